@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from pathlib import Path
+from time import perf_counter
+from typing import Tuple
+import argparse
+import os
+import sys
+
+
+def parse_resolution(value: str) -> Tuple[int, int]:
+    """Returns (height, width) of a resolution given as N or WIDTHxHEIGHT"""
+    try:
+        width, _, height = value.lower().partition("x")
+        return int(height or width), int(width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected N or WIDTHxHEIGHT, got '{value}'") from None
+
+
+def main() -> int:
+    # The project-modules are imported only after parsing, so --help answers without loading Qiskit and Numba
+    parser = argparse.ArgumentParser(prog="python -m quantum_fractals_guidebook",
+                                     description="Renders quantum fractal animations without a notebook")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="render an animation to a GIF, a video or a directory of PNG frames")
+    circuit = render.add_mutually_exclusive_group(required=True)
+    circuit.add_argument("--qasm", type=Path, help="OpenQASM 2 or 3 file of the quantum circuit")
+    circuit.add_argument("--preset", choices=["hadamard", "hadamard-u", "ry-tdg", "bell-u"],
+                         help="one of the default circuits of the notebooks")
+    render.add_argument("--output", type=Path, required=True,
+                        help="a .gif, a video file encoded by ffmpeg such as .mp4 or .webm, or a directory without "
+                             "suffix for PNG frames")
+    render.add_argument("--frames", type=int, default=60)
+    render.add_argument("--rotate", choices=["first", "last", "all"], default="first",
+                        help="the qubit(s) rotated by Rz from frame to frame (default: first)")
+    render.add_argument("--resolution", type=parse_resolution, default=(200, 200),
+                        help="N or WIDTHxHEIGHT of each Julia Set (default: 200)")
+    render.add_argument("--equations", nargs="+", choices=["1cn0", "2cn1", "2cn2", "general"],
+                        default=["1cn0", "2cn1", "2cn2"], help="Julia Set kernels shown side by side")
+    render.add_argument("--iterations", type=int, default=100)
+    render.add_argument("--escape-number", type=int, default=2)
+    render.add_argument("--zoom", type=float, default=1.0)
+    render.add_argument("--center", type=float, nargs=2, default=(0.0, 0.0), metavar=("RE", "IM"),
+                        help="center of the frame, e.g. --center -0.5 0.2 (default: 0 0)")
+    render.add_argument("--interval-ms", type=int, default=200, help="time between frames (default: 200)")
+    render.add_argument("--cmap", default="magma")
+    render.add_argument("--no-bloch", action="store_true", help="leave out the Bloch sphere panel")
+    render.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    render.add_argument("--profile", action="store_true", help="print the time spent per stage")
+    arguments = parser.parse_args()
+
+    # Numba stores the cached kernels next to the modules together with the module name they were compiled
+    # under, which is 'utils.*' in the notebooks. The package gets its own cache, which the workers inherit.
+    os.environ.setdefault("NUMBA_CACHE_DIR", str(Path.home() / ".cache" / "quantum_fractals_guidebook" / "numba"))
+
+    from .utils.fractal_julia_arrays import GetJuliaArrays
+    from .utils.fractal_profiling import Profiler
+    from .utils.fractal_render import get_preset_circuit, load_circuit, render_to_disk
+
+    quantum_circuit = load_circuit(arguments.qasm) if arguments.qasm else get_preset_circuit(arguments.preset)
+    height, width = arguments.resolution
+    julia_arrays = GetJuliaArrays(arguments.iterations, arguments.center[0], 1.5, arguments.center[1], 1.5,
+                                  height, width, arguments.zoom)
+    profiler = Profiler() if arguments.profile else None
+
+    start = perf_counter()
+    number_of_frames = render_to_disk(quantum_circuit, arguments.output, julia_arrays, arguments.frames,
+                                      arguments.rotate, arguments.equations, arguments.interval_ms, arguments.cmap,
+                                      not arguments.no_bloch, arguments.workers, arguments.escape_number,
+                                      profiler=profiler)
+    print(f"Wrote {number_of_frames} frames to {arguments.output} in {perf_counter() - start:.1f}s")
+    if profiler is not None:
+        profiler.close()
+        print(profiler.format_report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from pathlib import Path
+import argparse
+import json
+import sys
+
+# Import project-modules
+from .bench_cases import get_matrix
+from .bench_compare import compare_results, get_regressions, format_comparisons
+from .bench_runner import run_matrix
+from .bench_startup import run_startup, format_startup
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m quantum_fractals_guidebook.benchmarks",
+                                     description="Benchmarks of the Julia kernels, circuit simulation and "
+                                                 "visualization")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run a benchmark matrix and write the results as JSON")
+    run.add_argument("--matrix", choices=["quick", "default", "full"], default="default")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+
+    compare = commands.add_parser("compare", help="compare two results and fail on a regression")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=0.1,
+                         help="relative slowdown of the warm time counted as a regression (default: 0.1)")
+    compare.add_argument("--all", action="store_true", help="print every comparison, not only the regressions")
+
+    startup = commands.add_parser("startup", help="check the import time of the modules against their budget")
+    startup.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+
+    if arguments.command == "run":
+        results = run_matrix(get_matrix(arguments.matrix), arguments.repeats)
+        arguments.output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote {len(results['results'])} results to {arguments.output}")
+        return 0
+
+    if arguments.command == "startup":
+        results = run_startup(repeats=arguments.repeats)
+        print(format_startup(results))
+        return 0 if all(result.ok for result in results) else 1
+
+    comparisons = compare_results(json.loads(arguments.baseline.read_text()),
+                                  json.loads(arguments.current.read_text()))
+    regressions = get_regressions(comparisons, arguments.threshold)
+    if arguments.all:
+        print(format_comparisons(comparisons))
+    if regressions:
+        print(f"{len(regressions)} regressions above {arguments.threshold:.0%}:")
+        print(format_comparisons(regressions))
+        return 1
+    print(f"No regressions above {arguments.threshold:.0%} in {len(comparisons)} comparisons")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from itertools import product
+from os import cpu_count
+from typing import Dict, List, NamedTuple, Union
+import json
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+
+# Julia kernels, of which general is benchmarked for 1 to 5 qubits
+EQUATIONS: List[str] = ["1cn0", "2cn1", "2cn2", "general"]
+ENGINES: Dict[str, List[str]] = {"kernel": ["numba", "numpy", "periodic"], "circuit": ["simulator", "analytic"],
+                                 "visualization": ["pil"]}
+
+# Frame of the default 60 frame animation used as input of every case, so results are comparable across commits
+BENCHMARK_FRAME: int = 20
+BENCHMARK_FRAMES: int = 60
+
+
+class BenchmarkCase(NamedTuple):
+    stage: str          # kernel, circuit or visualization
+    engine: str         # numba, numpy or periodic (kernel), simulator or analytic (circuit), pil (visualization)
+    equation: str       # Julia equation of a kernel case, empty otherwise
+    qubits: int
+    resolution: int     # Height and width of the frame
+    iterations: int
+    threads: int
+
+    @property
+    def key(self) -> str:
+        """Identifies a case in the JSON results, independent of the order of the matrix"""
+        return json.dumps(self._asdict(), sort_keys=True)
+
+
+def get_thread_counts() -> List[int]:
+    """A single thread and every core"""
+    return sorted({1, cpu_count() or 1})
+
+
+def get_kernel_cases(resolutions: List[int], iterations: List[int], engines: List[str]) -> List[BenchmarkCase]:
+    cases = []
+    for engine, resolution, iteration, threads in product(engines, resolutions, iterations, get_thread_counts()):
+        # Threads only apply to the Numba engines
+        if engine == "numpy" and threads != 1:
+            continue
+        for equation in EQUATIONS:
+            for qubits in (range(1, 6) if equation == "general" else [1]):
+                cases.append(BenchmarkCase("kernel", engine, equation, qubits, resolution, iteration, threads))
+    return cases
+
+
+def get_matrix(name: str = "default") -> List[BenchmarkCase]:
+    """
+    Returns the cases of a named benchmark matrix:
+        quick:   200^2 pixels, to check a change within a minute or two
+        default: 200^2 to 1024^2 pixels
+        full:    200^2 to 4096^2 pixels at 100 and 1000 iterations, which takes hours on a laptop
+    The periodic engine, which stops iterating interior pixels that run into a cycle, is compared with numba at
+    1000 iterations, where the interior costs the most.
+    """
+    if name == "quick":
+        kernel = get_kernel_cases([200], [100], ["numba", "numpy"]) + \
+                 get_kernel_cases([200], [1000], ["numba", "periodic"])
+        resolutions = [200]
+    elif name == "default":
+        kernel = get_kernel_cases([200, 1024], [100], ["numba"]) + get_kernel_cases([200], [100], ["numpy"]) + \
+                 get_kernel_cases([200], [1000], ["numba", "periodic"])
+        resolutions = [200, 1024]
+    elif name == "full":
+        kernel = get_kernel_cases([200, 1024, 4096], [100, 1000], ["numba"]) + \
+                 get_kernel_cases([200, 1024], [100], ["numpy"]) + \
+                 get_kernel_cases([200, 1024, 4096], [100, 1000], ["periodic"])
+        resolutions = [200, 1024, 4096]
+    else:
+        raise ValueError(f"Unknown benchmark matrix '{name}', expected one of quick, default, full")
+
+    circuit = [BenchmarkCase("circuit", engine, "", qubits, 0, 0, 1)
+               for engine in ENGINES["circuit"] for qubits in (1, 3, 5)]
+    visualization = [BenchmarkCase("visualization", "pil", "", 1, resolution, 0, 1) for resolution in resolutions]
+    return kernel + circuit + visualization
+
+
+def get_statevector(qubits: int, frame: int = BENCHMARK_FRAME, frames: int = BENCHMARK_FRAMES) -> ndarray:
+    """
+    Statevector of a frame of the animation of H on every qubit, rotating the first qubit with Rz, computed
+    directly so the kernel cases do not depend on Qiskit.
+    """
+    basis_states = np.arange(2 ** qubits)
+    phi = frame * 2 * np.pi / frames
+    return np.exp(0.5j * phi * (2 * (basis_states & 1) - 1)) / np.sqrt(2 ** qubits)
+
+
+def get_case_input(case: Union[BenchmarkCase, Dict]) -> Union[complex, ndarray]:
+    """Returns the complex number (1cn0) or statevector a kernel case is rendered with"""
+    case = BenchmarkCase(**case) if isinstance(case, dict) else case
+    statevector = get_statevector(case.qubits)
+    if case.equation == "1cn0":
+        ratio = statevector[0] / statevector[1]
+        return round(ratio.real, 2) + round(ratio.imag, 2) * 1j
+    return statevector
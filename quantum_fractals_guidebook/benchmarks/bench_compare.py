@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import Dict, List, NamedTuple
+
+# Import project-modules
+from .bench_cases import BenchmarkCase
+
+
+class Comparison(NamedTuple):
+    case: BenchmarkCase
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, where a positive value is slower or larger"""
+        return self.current / self.baseline - 1
+
+
+# Metrics compared between two runs, all of which are better when lower
+METRICS: List[str] = ["warm_min_s", "cold_s", "peak_rss_mb"]
+
+
+def compare_results(baseline: Dict, current: Dict, metrics: List[str] = METRICS) -> List[Comparison]:
+    """Returns the comparisons of every metric of the cases present in both results"""
+    baseline_results = {BenchmarkCase(**result["case"]).key: result for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        case = BenchmarkCase(**result["case"])
+        reference = baseline_results.get(case.key)
+        if reference is None:
+            continue
+        for metric in metrics:
+            if reference.get(metric) and result.get(metric) is not None:
+                comparisons.append(Comparison(case, metric, reference[metric], result[metric]))
+    return comparisons
+
+
+def get_regressions(comparisons: List[Comparison], threshold: float = 0.1,
+                    metrics: List[str] = ("warm_min_s",)) -> List[Comparison]:
+    """
+    Returns the comparisons that got worse by more than threshold, e.g. 0.1 for 10%. Only the warm time is
+    checked by default, as cold times depend on the disk and peak RSS on the allocator.
+    """
+    return [comparison for comparison in comparisons
+            if comparison.metric in metrics and comparison.change > threshold]
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    lines = []
+    for comparison in comparisons:
+        case = comparison.case
+        lines.append(f"{case.stage:<13} {case.engine:<9} {case.equation:<7} q={case.qubits} {case.resolution:>4}px "
+                     f"{case.iterations:>4}it {case.threads}t {comparison.metric:<13} {comparison.baseline:>10.4f} "
+                     f"-> {comparison.current:>10.4f} ({comparison.change:+.1%})")
+    return "\n".join(lines)
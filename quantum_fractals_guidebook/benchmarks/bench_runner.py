@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List, Union
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+# Import externally installed libraries
+import numpy as np
+
+# Import project-modules
+from .bench_cases import BenchmarkCase, BENCHMARK_FRAMES, get_case_input, get_statevector
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def get_peak_rss_mb() -> Union[float, None]:
+    """Peak resident set size of this process in MB, which is reported in KB on Linux and in bytes on macOS"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def get_kernel(case: BenchmarkCase) -> Callable[[], np.ndarray]:
+    """Returns a function rendering the frame of a kernel case"""
+    from ..utils.fractal_julia_arrays import get_complex_grid
+    z = get_complex_grid(-1.5, 1.5, -1.5, 1.5, case.resolution, case.resolution)
+    c = get_case_input(case)
+    div = np.empty((1, case.resolution, case.resolution), dtype=np.uint16)
+
+    if case.engine == "numba":
+        import numba
+        from ..utils.fractal_julia_batch import render_frames
+        numba.set_num_threads(min(case.threads, numba.config.NUMBA_NUM_THREADS))
+        return lambda: render_frames([c], z, case.equation, case.iterations, out=div)
+
+    if case.engine == "periodic":
+        import numba
+        from ..utils.fractal_julia_periodicity import render_periodic
+        numba.set_num_threads(min(case.threads, numba.config.NUMBA_NUM_THREADS))
+        return lambda: render_periodic(z, c, case.equation, case.iterations)[0]
+
+    from ..utils.fractal_julia_numpy import render_numpy
+    return lambda: render_numpy([c], z, case.equation, case.iterations, out=div)
+
+
+def get_circuit(case: BenchmarkCase) -> Callable[[], object]:
+    """Returns a function computing the statevectors of every frame of the animation of a circuit case"""
+    from qiskit import QuantumCircuit
+    from ..utils.fractal_quantum_circuit import FractalQuantumCircuit
+    quantum_circuit = QuantumCircuit(case.qubits)
+    quantum_circuit.h(range(case.qubits))
+    fractal_circuit = FractalQuantumCircuit(case.qubits, quantum_circuit, BENCHMARK_FRAMES)
+
+    if case.engine == "analytic":
+        return fractal_circuit.get_statevectors
+    return lambda: [fractal_circuit.get_quantum_circuit(frame_iteration=frame) for frame in range(BENCHMARK_FRAMES)]
+
+
+def get_visualization(case: BenchmarkCase) -> Callable[[], np.ndarray]:
+    """Returns a function composing a frame of the Bloch sphere and three escape-time maps into RGB"""
+    from ..utils.fractal_bloch import BlochRenderer
+    from ..utils.fractal_colormap import compose_frame
+    rng = np.random.default_rng(0)
+    div = rng.integers(0, 100, size=(case.resolution, case.resolution), dtype=np.uint16)
+    statevector = get_statevector(case.qubits)
+
+    def visualize():
+        # A new renderer every call, as its cache would otherwise skip the rendering of the sphere
+        return compose_frame([BlochRenderer(size=case.resolution).render(statevector), div, div, div])
+    return visualize
+
+
+def run_case(case: BenchmarkCase, repeats: int = 5) -> Dict:
+    """
+    Runs a case in this process: the first call is timed as cold, which includes the JIT compilation when
+    Numba's cache is empty, after which the case is repeated and timed as warm.
+    """
+    get_function = {"kernel": get_kernel, "circuit": get_circuit, "visualization": get_visualization}[case.stage]
+    function = get_function(case)
+
+    start = perf_counter()
+    output = function()
+    cold = perf_counter() - start
+
+    warm = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        warm.append(perf_counter() - start)
+
+    result = {"case": case._asdict(), "cold_s": cold, "warm_min_s": min(warm), "warm_median_s": median(warm),
+              "repeats": repeats}
+    if case.stage == "kernel":
+        from ..utils.fractal_profiling import get_pixel_iterations
+        pixel_iterations = get_pixel_iterations(output)
+        result["pixel_iterations"] = pixel_iterations
+        result["pixel_iterations_per_s"] = pixel_iterations / min(warm)
+    result["peak_rss_mb"] = get_peak_rss_mb()
+    return result
+
+
+def run_case_isolated(case: BenchmarkCase, repeats: int = 5) -> Dict:
+    """
+    Runs a case in a fresh interpreter with an empty Numba cache, so cold is the time of a first render in a
+    new environment and the peak RSS belongs to this case alone.
+    """
+    with TemporaryDirectory() as cache_dir:
+        environment = {**os.environ, "NUMBA_CACHE_DIR": cache_dir}
+        process = subprocess.run([sys.executable, "-m", "quantum_fractals_guidebook.benchmarks.bench_runner",
+                                  json.dumps(case._asdict()), "--repeats", str(repeats)],
+                                 cwd=REPOSITORY_ROOT, env=environment, capture_output=True, text=True)
+    if process.returncode != 0:
+        return {"case": case._asdict(), "error": process.stderr.strip().splitlines()[-1:]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def get_environment() -> Dict:
+    """Versions, hardware and commit the results were measured with"""
+    versions = {}
+    for module in ("numpy", "numba", "qiskit", "PIL"):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPOSITORY_ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {"commit": commit, "timestamp": datetime.now(timezone.utc).isoformat(), "python": platform.python_version(),
+            "platform": platform.platform(), "processor": platform.processor(), "cpu_count": os.cpu_count(),
+            "versions": versions}
+
+
+def run_matrix(cases: List[BenchmarkCase], repeats: int = 5, verbose: bool = True) -> Dict:
+    """Runs every case in isolation and returns the results together with the environment"""
+    results = []
+    for index, case in enumerate(cases):
+        result = run_case_isolated(case, repeats)
+        results.append(result)
+        if verbose:
+            summary = result.get("error") or f"cold {result['cold_s']:.3f}s, warm {result['warm_min_s']:.4f}s"
+            print(f"[{index + 1:>3}/{len(cases)}] {case.stage:<13} {case.engine:<9} {case.equation:<7} "
+                  f"q={case.qubits} {case.resolution:>4}px {case.iterations:>4}it {case.threads}t: {summary}",
+                  file=sys.stderr)
+    return {"environment": get_environment(), "results": results}
+
+
+if __name__ == "__main__":
+    # Entry point of <run_case_isolated>, printing the result of a single case as JSON
+    parser = argparse.ArgumentParser()
+    parser.add_argument("case")
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+    print(json.dumps(run_case(BenchmarkCase(**json.loads(arguments.case)), arguments.repeats)))
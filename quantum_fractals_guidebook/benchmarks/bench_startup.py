@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import Dict, List, NamedTuple, Tuple
+import json
+import subprocess
+import sys
+
+# Import project-modules
+from .bench_runner import REPOSITORY_ROOT
+
+
+class ImportBudget(NamedTuple):
+    seconds: float                  # Wall time of the import in a fresh interpreter with compiled bytecode
+    deferred: Tuple[str, ...]       # Top-level packages the import must not load
+
+
+# Documented in the README, where the seconds leave room for slower machines than the one they were measured on
+IMPORT_BUDGETS: Dict[str, ImportBudget] = {
+    "quantum_fractals_guidebook.utils.fractal_julia_arrays": ImportBudget(0.3, ("numba", "qiskit", "matplotlib")),
+    "quantum_fractals_guidebook.utils.fractal_quantum_circuit": ImportBudget(0.3, ("numba", "qiskit", "matplotlib")),
+    "quantum_fractals_guidebook.utils.fractal_visualization": ImportBudget(
+        0.5, ("numba", "qiskit", "matplotlib", "IPython", "celluloid")),
+    "quantum_fractals_guidebook.utils.fractal_julia_calculations": ImportBudget(1.0, ("qiskit", "matplotlib")),
+    "quantum_fractals_guidebook.utils.fractal_render": ImportBudget(1.0, ("qiskit", "matplotlib", "IPython")),
+}
+
+# Executed by a fresh interpreter, prints the import time and the loaded top-level packages as JSON
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "packages": sorted({{name.split(".")[0] for name in sys.modules}})}}))
+"""
+
+
+class StartupResult(NamedTuple):
+    module: str
+    seconds: float                  # Fastest of the repeats
+    budget: ImportBudget
+    loaded: Tuple[str, ...]         # Deferred packages that were loaded anyway
+
+    @property
+    def ok(self) -> bool:
+        return self.seconds <= self.budget.seconds and not self.loaded
+
+
+def measure_import(module: str, repeats: int = 5) -> Tuple[float, Tuple[str, ...]]:
+    """
+    Returns the fastest import time of a module over fresh interpreters and the top-level packages it loaded.
+    The first import also writes the bytecode, so the fastest run is the import time of an installed package.
+    """
+    times, packages = [], ()
+    for _ in range(repeats):
+        process = subprocess.run([sys.executable, "-c", MEASURE_SCRIPT.format(module=module)], cwd=REPOSITORY_ROOT,
+                                 capture_output=True, text=True, check=True)
+        measurement = json.loads(process.stdout.strip().splitlines()[-1])
+        times.append(measurement["seconds"])
+        packages = tuple(measurement["packages"])
+    return min(times), packages
+
+
+def run_startup(budgets: Dict[str, ImportBudget] = IMPORT_BUDGETS, repeats: int = 5) -> List[StartupResult]:
+    results = []
+    for module, budget in budgets.items():
+        seconds, packages = measure_import(module, repeats)
+        loaded = tuple(package for package in budget.deferred if package in packages)
+        results.append(StartupResult(module, seconds, budget, loaded))
+    return results
+
+
+def format_startup(results: List[StartupResult]) -> str:
+    lines = []
+    for result in results:
+        status = "ok" if result.ok else "OVER BUDGET"
+        loaded = f" loaded {', '.join(result.loaded)}" if result.loaded else ""
+        lines.append(f"{result.module:<60} {result.seconds:>6.3f}s / {result.budget.seconds:.1f}s {status}{loaded}")
+    return "\n".join(lines)
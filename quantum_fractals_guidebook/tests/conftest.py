@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from pathlib import Path
+import os
+
+# Import externally installed libraries
+import pytest
+
+# Numba stores the cached kernels next to the modules together with the module name they were compiled under,
+# which is 'utils.*' in the notebooks. The tests import the package and share the cache of the command line.
+os.environ.setdefault("NUMBA_CACHE_DIR", str(Path.home() / ".cache" / "quantum_fractals_guidebook" / "numba"))
+
+# Import project-modules, after the cache directory is set
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays  # noqa: E402
+from .julia_corpus import ITERATIONS, RESOLUTIONS  # noqa: E402
+
+
+@pytest.fixture(params=[(resolution, iterations) for resolution in RESOLUTIONS for iterations in ITERATIONS],
+                ids=lambda param: f"{param[0]}px-{param[1]}it")
+def julia_arrays(request) -> GetJuliaArrays:
+    """The grids of the corpus, one per resolution and number of iterations"""
+    resolution, iterations = request.param
+    return GetJuliaArrays(iterations, 0.0, 1.5, 0.0, 1.5, resolution, resolution)
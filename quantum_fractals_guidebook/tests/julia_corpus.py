@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import List, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+from numpy import ndarray
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_julia_calculations import set_1cn0, set_2cn1, set_2cn2
+
+
+# Corpus of the engines that claim to return the same escape-time maps as the original kernels
+# ───────────────────────────────────────────────────────────
+# The original kernels index z[x, y] with x < width and y < height, so the corpus is limited to square grids.
+RESOLUTIONS: List[int] = [64, 129]
+ITERATIONS: List[int] = [50, 300]
+NUMBER_OF_STATEVECTORS: int = 6
+
+
+def get_statevectors(seed: int = 2024, number: int = NUMBER_OF_STATEVECTORS, qubits: int = 1) -> List[ndarray]:
+    """Random normalized statevectors, which for a single qubit are the c values of 2cn1 and 2cn2"""
+    rng = np.random.default_rng(seed)
+    shape = (number, 2 ** qubits)
+    vectors = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    return list(vectors / np.linalg.norm(vectors, axis=1, keepdims=True))
+
+
+STATEVECTORS: List[ndarray] = get_statevectors()
+# The c value of 1cn0 is the coherence a * conj(b) of the statevector, which lies within |c| <= 1/2 and mostly
+# gives connected Julia Sets with a large interior
+CORPUS: List[Tuple[complex, ndarray]] = [(complex(vector[0] * vector[1].conj()), vector) for vector in STATEVECTORS]
+BASELINE = {"1cn0": set_1cn0, "2cn1": set_2cn1, "2cn2": set_2cn2}
+
+
+def get_c(equation: str, c: complex, statevector: ndarray) -> Union[complex, ndarray]:
+    return c if equation == "1cn0" else statevector
+
+
+def get_baseline(equation: str, c: Union[complex, ndarray], julia_arrays: GetJuliaArrays) -> ndarray:
+    """The escape-time map of the original kernel, which writes to z and con and therefore gets its own copies"""
+    div = julia_arrays.get_diverged_array()
+    BASELINE[equation](c, julia_arrays.get_z_array().copy(), julia_arrays.get_converging_array(), div,
+                       julia_arrays.julia_iterations, 2, *julia_arrays.shape)
+    return div
+
+
+corpus = pytest.mark.parametrize("c, statevector", CORPUS, ids=[f"sv{index}" for index in range(len(CORPUS))])
+equations = pytest.mark.parametrize("equation", ["1cn0", "2cn1", "2cn2"])
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_frame_scheduler import render_animation
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_render import get_bell_u_circuit
+
+pytest.importorskip("qiskit")
+
+
+def test_render_animation_rotate():
+    julia_arrays = GetJuliaArrays(50, 0.0, 1.5, 0.0, 1.5, 48, 48)
+    results = {rotate: list(render_animation(get_bell_u_circuit(), julia_arrays, number_of_frames=4, rotate=rotate,
+                                             equations=("2cn1", "general"), workers=1))
+               for rotate in ("first", "last", "all")}
+
+    # Frame 0 has no rotation, every later frame rotates other qubits in each mode
+    for frame in range(4):
+        statevectors = [results[rotate][frame].statevector for rotate in ("first", "last", "all")]
+        julia = [results[rotate][frame].julia for rotate in ("first", "last", "all")]
+        if frame == 0:
+            assert all(np.array_equal(julia[0], other) for other in julia[1:])
+            continue
+        for index, other in ((0, 1), (0, 2), (1, 2)):
+            assert not np.allclose(statevectors[index], statevectors[other])
+        assert not np.array_equal(julia[1], julia[2])
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_adaptive import (choose_iterations, get_adaptive_budget,
+                                                                     render_adaptive)
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frame
+
+
+def test_choose_iterations():
+    # 1000 pixels escaping in iteration 0-9, ten slow ones and the interior, which is set to preview_iterations - 1
+    preview = np.concatenate([np.arange(1000) % 10, np.full(10, 40), np.full(100, 63)])
+    assert choose_iterations(preview, 64, percentile=99.0, headroom=2.0, min_iterations=1) == 19
+    assert choose_iterations(preview, 64, percentile=99.0, headroom=2.0) == 20
+    assert choose_iterations(preview, 64, percentile=100.0, headroom=1.5) == 61
+    assert choose_iterations(np.full(16, 63), 64) == 20
+
+
+def test_get_adaptive_budget():
+    julia_arrays = GetJuliaArrays(100, 0.0, 1.5, 0.0, 1.5, 256, 256)
+
+    # Everything escapes within a few iterations, so the minimum budget is enough
+    budget = get_adaptive_budget(julia_arrays, 1 + 1j)
+    assert (budget.max_iterations, budget.preview_iterations, budget.escaped_fraction) == (20, 64, 1.0)
+
+    # Many pixels escape late in the first preview, which is repeated with twice the budget
+    budget = get_adaptive_budget(julia_arrays, 0.28 + 0.008j)
+    assert budget.preview_iterations == 128
+    assert budget.ambiguous_fraction <= 0.01
+    assert budget.max_iterations > budget.preview_iterations
+
+    # The budget is capped by max_iterations, while the ambiguous preview keeps its full budget
+    budget = get_adaptive_budget(julia_arrays, 0.28 + 0.008j, max_iterations=64)
+    assert (budget.max_iterations, budget.preview_iterations) == (64, 64)
+    assert budget.ambiguous_fraction > 0.01
+
+
+@pytest.mark.parametrize("c", [-0.8 + 0.156j, 0.28 + 0.008j, -0.4 + 0.6j])
+def test_render_adaptive(c):
+    julia_arrays = GetJuliaArrays(100, 0.0, 1.5, 0.0, 1.5, 256, 256)
+    div, budget = render_adaptive(julia_arrays, c)
+    assert div.shape == julia_arrays.shape
+
+    # Pixels escaping within the budget have the escape time of a render with a larger budget
+    reference = render_frame(c, julia_arrays.get_z_array(), "1cn0", 4096)
+    escaped = div < budget.max_iterations - 1
+    np.testing.assert_array_equal(div[escaped], reference[escaped])
+    assert np.all(reference[~escaped] >= budget.max_iterations - 1)
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+
+
+def test_get_z_array_keeps_last_grid():
+    julia_arrays = GetJuliaArrays(50, 0.0, 1.5, 0.0, 1.5, 64, 64)
+    grid = julia_arrays.get_z_array()
+    assert julia_arrays.get_z_array() is grid
+    assert not grid.flags.writeable
+
+    # A new window replaces the grid instead of keeping both alive
+    julia_arrays.zoom = 2.0
+    zoomed = julia_arrays.get_z_array()
+    assert zoomed is not grid and julia_arrays.grid is zoomed
+    assert abs(zoomed.real).max() < abs(grid.real).max()
+
+    # Instances do not share grids
+    assert GetJuliaArrays(50, 0.0, 1.5, 0.0, 1.5, 64, 64).get_z_array() is not zoomed
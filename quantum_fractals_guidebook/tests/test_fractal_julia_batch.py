@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frames
+from .julia_corpus import CORPUS, equations, get_baseline, get_c
+
+
+@equations
+def test_render_frames(julia_arrays, equation):
+    # All frames of the corpus in a single call, as for an animation
+    c_values = [get_c(equation, c, statevector) for c, statevector in CORPUS]
+    div = render_frames(c_values, julia_arrays.get_z_array(), equation, julia_arrays.julia_iterations)
+    for frame, c in enumerate(c_values):
+        np.testing.assert_array_equal(div[frame], get_baseline(equation, c, julia_arrays))
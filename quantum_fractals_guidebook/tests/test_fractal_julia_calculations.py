@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_calculations import (set_1cn0_fast, set_2cn1_fast, set_2cn2_fast,
+                                                                          set_fused)
+from .julia_corpus import corpus, equations, get_baseline, get_c
+
+FAST = {"1cn0": set_1cn0_fast, "2cn1": set_2cn1_fast, "2cn2": set_2cn2_fast}
+
+
+@corpus
+@equations
+def test_fast_kernels(julia_arrays, equation, c, statevector):
+    c = get_c(equation, c, statevector)
+    baseline = get_baseline(equation, c, julia_arrays)
+    for con in (julia_arrays.get_converging_array(), None):
+        div = julia_arrays.get_diverged_array()
+        FAST[equation](c, julia_arrays.get_z_array(), con, div, julia_arrays.julia_iterations, 2, *julia_arrays.shape)
+        np.testing.assert_array_equal(div, baseline)
+
+
+@corpus
+def test_fused(julia_arrays, c, statevector):
+    div = julia_arrays.get_output_buffer("fused", layers=3)
+    set_fused(c, statevector, julia_arrays.get_z_array(), div, julia_arrays.julia_iterations, 2, *julia_arrays.shape)
+    for layer, equation in enumerate(("1cn0", "2cn1", "2cn2")):
+        np.testing.assert_array_equal(div[layer], get_baseline(equation, get_c(equation, c, statevector),
+                                                               julia_arrays))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_generalized import (set_general, set_general_horner,
+                                                                         get_fraction_powers_and_indices,
+                                                                         get_fraction_coefficients)
+from .julia_corpus import get_statevectors
+
+
+# Largest fraction of pixels whose escape time differs. From 3 qubits on, <set_general> rounds the powers z^k
+# differently from Horner's scheme. One of the 3 qubit statevectors has a boundary so sensitive that moving the grid
+# by a single ulp changes about 2% of the pixels, which is the order of the bound.
+MISMATCH_FRACTIONS = {1: 0.0, 2: 0.0, 3: 0.05, 4: 0.05}
+
+
+@pytest.mark.parametrize("qubits", [1, 2, 3, 4])
+def test_set_general_horner(julia_arrays, qubits):
+    powers_and_indices = get_fraction_powers_and_indices(qubits)
+    for c in get_statevectors(seed=qubits, number=3, qubits=qubits):
+        upper_coef, lower_coef = get_fraction_coefficients(c, *powers_and_indices)
+        horner = set_general_horner(upper_coef, lower_coef, julia_arrays.get_z_array(),
+                                    julia_arrays.get_converging_array(), julia_arrays.get_diverged_array(),
+                                    julia_arrays.julia_iterations, 2, *julia_arrays.shape)
+
+        # The original kernel writes to z and con, so it gets its own copies
+        general = set_general(c, julia_arrays.get_z_array().copy(), julia_arrays.get_converging_array(),
+                              julia_arrays.get_diverged_array(), *powers_and_indices, julia_arrays.julia_iterations,
+                              qubits, 2, *julia_arrays.shape)
+        assert np.mean(horner != general) <= MISMATCH_FRACTIONS[qubits]
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frames
+from quantum_fractals_guidebook.utils.fractal_julia_numpy import render_numpy
+from .julia_corpus import corpus, equations, get_baseline, get_c, get_statevectors
+
+
+@corpus
+@equations
+def test_render_numpy(julia_arrays, equation, c, statevector):
+    c = get_c(equation, c, statevector)
+    div = render_numpy([c], julia_arrays.get_z_array(), equation, julia_arrays.julia_iterations)[0]
+    np.testing.assert_array_equal(div, get_baseline(equation, c, julia_arrays))
+
+
+@pytest.mark.parametrize("equation, c", [("2cn1", [-0.0379 + 0.4221j, -0.1035 - 0.8998j]),
+                                         ("2cn2", [0.7059 - 0.4187j, 0.3480 + 0.4531j])])
+def test_render_numpy_division(equation, c):
+    # Pixels on the boundary of the set whose escape time depends on the rounding of the complex division
+    z = GetJuliaArrays(300, 0.0, 1.5, 0.0, 1.5, 256, 256).get_z_array()
+    np.testing.assert_array_equal(render_numpy([c], z, equation, 300), render_frames([c], z, equation, 300))
+
+
+@pytest.mark.parametrize("qubits", [2, 3, 4])
+def test_render_numpy_general(julia_arrays, qubits):
+    c_values = get_statevectors(seed=qubits, number=3, qubits=qubits)
+    z = julia_arrays.get_z_array()
+    np.testing.assert_array_equal(render_numpy(c_values, z, "general", julia_arrays.julia_iterations),
+                                  render_frames(c_values, z, "general", julia_arrays.julia_iterations))
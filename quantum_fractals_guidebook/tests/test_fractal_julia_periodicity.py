@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frames
+from quantum_fractals_guidebook.utils.fractal_julia_calculations import get_escape_bound
+from quantum_fractals_guidebook.utils.fractal_julia_coefficients import EQUATIONS
+from quantum_fractals_guidebook.utils.fractal_julia_equations import escape_time
+from quantum_fractals_guidebook.utils.fractal_julia_periodicity import escape_time_periodic, render_periodic
+from .julia_corpus import corpus, equations, get_c, get_statevectors
+
+
+def check_periodic(z, c, equation, max_iterations):
+    div, period = render_periodic(z, c, equation, max_iterations)
+    np.testing.assert_array_equal(div, render_frames([c], z, equation, max_iterations)[0])
+    # Only pixels that did not escape can have found a cycle
+    assert np.all(div[period > 0] == max_iterations - 1)
+
+
+@corpus
+@equations
+def test_render_periodic(julia_arrays, equation, c, statevector):
+    check_periodic(julia_arrays.get_z_array(), get_c(equation, c, statevector), equation, julia_arrays.julia_iterations)
+
+
+@pytest.mark.parametrize("qubits", [2, 3, 4])
+def test_render_periodic_general(julia_arrays, qubits):
+    for c in get_statevectors(seed=qubits, number=3, qubits=qubits):
+        check_periodic(julia_arrays.get_z_array(), c, "general", julia_arrays.julia_iterations)
+
+
+def test_escape_time_periodic():
+    # For c = -1, 0 lies on the superattracting cycle 0 -> -1 -> 0 of z^2 + c
+    coef = np.array([-1 + 0j])
+    escape_bound = get_escape_bound(2)
+    assert escape_time_periodic(EQUATIONS["1cn0"], 0j, coef, 100, 2, escape_bound, 1e-10) == (-1, 2)
+    for z in (0.5 + 0.5j, 1.2 + 0.3j, 2.5 + 0j):
+        assert escape_time_periodic(EQUATIONS["1cn0"], z, coef, 100, 2, escape_bound, 1e-10)[0] == \
+            escape_time(EQUATIONS["1cn0"], z, coef, 100, 2, escape_bound)
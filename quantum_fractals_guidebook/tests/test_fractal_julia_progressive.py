@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_progressive import render_progressive
+from .julia_corpus import corpus, equations, get_baseline, get_c
+
+
+@corpus
+@equations
+def test_render_progressive(julia_arrays, equation, c, statevector):
+    c = get_c(equation, c, statevector)
+    for scale, div in render_progressive(julia_arrays.get_z_array(), c, equation, julia_arrays.julia_iterations):
+        pass
+    assert scale == 1
+    np.testing.assert_array_equal(div, get_baseline(equation, c, julia_arrays))
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_julia_tiles import render_tiled
+from .julia_corpus import corpus, equations, get_baseline, get_c
+
+
+@corpus
+@equations
+def test_render_tiled(julia_arrays, equation, c, statevector, tmp_path):
+    # Tiles that do not divide the resolution, so the tiles at the bottom and right edges are partially filled
+    c = get_c(equation, c, statevector)
+    div = render_tiled(julia_arrays, c, tmp_path / "tiled.npy", equation, tile_size=48, tiles_per_launch=3)
+    np.testing.assert_array_equal(div, get_baseline(equation, c, julia_arrays))
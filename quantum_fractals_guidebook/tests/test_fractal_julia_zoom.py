@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from decimal import Decimal
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils import fractal_julia_zoom
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frames
+from quantum_fractals_guidebook.utils.fractal_julia_zoom import (render_zoom_path, get_reference_orbit,
+                                                                 get_rational_coefficients)
+from .julia_corpus import STATEVECTORS
+
+# Perturbation rounds differently than the float64 grid, which moves the escape time of a few boundary pixels
+MISMATCH_FRACTION = 1e-3
+
+
+def get_boundary_center(equation, c, max_iterations: int = 100) -> complex:
+    """Bisects between neighbouring grid points inside and outside the filled Julia set to reach its boundary"""
+    def is_inside(z: complex) -> bool:
+        div = render_frames([c], np.full((1, 1), z), equation, max_iterations)[0]
+        return div[0, 0] == max_iterations - 1
+
+    z = GetJuliaArrays(max_iterations, 0.0, 1.5, 0.0, 1.5, 64, 64).get_z_array()
+    inside = render_frames([c], z, equation, max_iterations)[0] == max_iterations - 1
+    edges = np.argwhere(inside[:, :-1] & ~inside[:, 1:])
+    row, col = edges[len(edges) // 2]
+    z_inside, z_outside = complex(z[row, col]), complex(z[row, col + 1])
+    for _ in range(40):
+        z_middle = (z_inside + z_outside) / 2
+        z_inside, z_outside = (z_middle, z_outside) if is_inside(z_middle) else (z_inside, z_middle)
+    return z_inside
+
+
+@pytest.mark.parametrize("equation, c", [("1cn0", -0.8 + 0.156j), ("2cn1", STATEVECTORS[0]),
+                                         ("2cn2", STATEVECTORS[1])])
+def test_render_zoom_path_perturbation(equation, c):
+    center = get_boundary_center(equation, c)
+    keyframes = [(center, 1.0), (center, 1e4)]
+    direct = list(render_zoom_path(keyframes, c, 5, equation, 96, 96, perturbation_zoom=np.inf))
+    perturbation = list(render_zoom_path(keyframes, c, 5, equation, 96, 96, perturbation_zoom=1.0))
+    for direct_frame, perturbation_frame in zip(direct, perturbation):
+        assert len(np.unique(direct_frame)) > 1
+        assert np.mean(direct_frame != perturbation_frame) <= MISMATCH_FRACTION
+
+
+def test_render_zoom_path_pole(monkeypatch):
+    # The center 0.5 is a pole of z^2 + c[1] for c[1] = -0.25, so its reference orbit holds a single point
+    c = np.array([0.3 + 0.2j, -0.25])
+    orbit = get_reference_orbit(*get_rational_coefficients("2cn1", c), (Decimal("0.5"), Decimal(0)), 100, 2, 40)
+    assert len(orbit) == 1
+
+    keyframes = [(0.5 + 0j, 1e11)]
+    direct = next(render_zoom_path(keyframes, c, 1, "2cn1", 64, 64, perturbation_zoom=np.inf))
+
+    # The frame is rendered directly instead of reading past the end of the orbit
+    def set_perturbation(*args):
+        raise AssertionError("set_perturbation called with a single-point orbit")
+    monkeypatch.setattr(fractal_julia_zoom, "set_perturbation", set_perturbation)
+    np.testing.assert_array_equal(next(render_zoom_path(keyframes, c, 1, "2cn1", 64, 64, perturbation_zoom=1e10)),
+                                  direct)
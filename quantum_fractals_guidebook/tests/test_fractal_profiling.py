@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+import tracemalloc
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_profiling import Profiler
+
+
+@pytest.fixture(autouse=True)
+def no_tracemalloc():
+    # Each test starts without tracing, whatever the previous one left behind
+    tracemalloc.stop()
+    yield
+    tracemalloc.stop()
+
+
+def test_close_stops_tracemalloc():
+    with Profiler() as profiler:
+        assert tracemalloc.is_tracing()
+        with profiler.stage("julia"):
+            pass
+    assert not tracemalloc.is_tracing()
+    assert len(profiler.records) == 1
+
+    # Stages after closing are still timed, without allocations
+    with profiler.stage("julia"):
+        np.ones(1 << 20)
+    assert profiler.records[-1].peak_bytes == 0
+
+
+def test_close_keeps_tracemalloc_of_others():
+    tracemalloc.start()
+    Profiler().close()
+    assert tracemalloc.is_tracing()
+
+
+def test_allocations():
+    with Profiler() as profiler:
+        with profiler.stage("compose"):
+            kept = [np.ones(1 << 17) for _ in range(100)]
+        with profiler.stage("bloch"):
+            [np.ones(1 << 17) for _ in range(100)]
+
+    compose, bloch = profiler.records
+    assert compose.peak_bytes >= 100 * 8 << 17 and bloch.peak_bytes >= 8 << 17
+    # The arrays that are kept alive after the stage count as allocated blocks
+    assert compose.allocated_blocks >= len(kept) > bloch.allocated_blocks
+    assert profiler.get_report()["compose"]["allocated_blocks"] == compose.allocated_blocks
+    assert profiler.get_chrome_trace()["traceEvents"][0]["args"]["allocated_blocks"] == compose.allocated_blocks
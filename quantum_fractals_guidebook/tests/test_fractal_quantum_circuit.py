@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from math import pi
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_quantum_circuit import FractalQuantumCircuit
+from quantum_fractals_guidebook.utils.fractal_render import PRESETS
+
+qiskit = pytest.importorskip("qiskit")
+
+
+def get_three_qubit_circuit() -> "qiskit.QuantumCircuit":
+    circuit = qiskit.QuantumCircuit(3)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.ry(pi / 3, 2)
+    circuit.u(pi / 4, -pi / 3, pi / 8, 1)
+    return circuit
+
+
+CIRCUITS = {**PRESETS, "three-qubit": get_three_qubit_circuit}
+
+
+@pytest.mark.parametrize("rotate", ["first", "last", "all"])
+@pytest.mark.parametrize("circuit", CIRCUITS)
+def test_get_statevectors(circuit, rotate):
+    quantum_circuit = CIRCUITS[circuit]()
+    fractal_circuit = FractalQuantumCircuit(quantum_circuit.num_qubits, quantum_circuit, total_number_of_frames=24)
+    statevectors_new, statevectors = fractal_circuit.get_statevectors(rotate)
+
+    for frame in range(fractal_circuit.n_frames):
+        statevector_new, _, statevector = fractal_circuit.get_quantum_circuit(rotate, frame)
+        np.testing.assert_allclose(statevectors[frame], statevector, rtol=0, atol=1e-15)
+        assert statevectors_new[frame] == statevector_new
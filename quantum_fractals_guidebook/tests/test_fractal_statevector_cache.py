@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from math import pi
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils import fractal_statevector_cache
+from quantum_fractals_guidebook.utils.fractal_quantum_circuit import FractalQuantumCircuit
+from quantum_fractals_guidebook.utils.fractal_statevector_cache import StatevectorCache
+
+qiskit = pytest.importorskip("qiskit")
+
+
+def get_circuit(angle: float = pi / 4, gate: str = "u") -> "qiskit.QuantumCircuit":
+    circuit = qiskit.QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    if gate == "u":
+        circuit.u(angle, -pi / 3, pi / 8, 1)
+    else:
+        circuit.ry(angle, 1)
+    return circuit
+
+
+def get_value(seed: int):
+    statevector = np.random.default_rng(seed).normal(size=4) + 0j
+    return complex(seed, -seed), statevector / np.linalg.norm(statevector)
+
+
+def test_hit_and_miss():
+    cache = StatevectorCache()
+    fractal_circuit = FractalQuantumCircuit(2, get_circuit(), total_number_of_frames=8, statevector_cache=cache)
+    statevector_new, _, statevector = fractal_circuit.get_quantum_circuit("all", 3)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cached_new, _, cached = fractal_circuit.get_quantum_circuit("all", 3)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached_new == statevector_new
+    np.testing.assert_array_equal(cached, statevector)
+
+    # The returned array is a copy, so the caller cannot change the cached entry
+    cached[:] = 0
+    np.testing.assert_array_equal(fractal_circuit.get_quantum_circuit("all", 3)[2], statevector)
+
+    fractal_circuit.get_quantum_circuit("all", 4)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_lru_eviction():
+    cache = StatevectorCache(max_entries=2)
+    cache.put("a", get_value(1))
+    cache.put("b", get_value(2))
+    assert cache.get("a") is not None
+    cache.put("c", get_value(3))
+
+    # "b" was the least recently used entry after "a" was read
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_key():
+    key = StatevectorCache.get_key(get_circuit(), [0, 1], 3, 8)
+    assert StatevectorCache.get_key(get_circuit(), [0, 1], 3, 8) == key
+    assert StatevectorCache.get_key(get_circuit(gate="ry"), [0, 1], 3, 8) != key
+    assert StatevectorCache.get_key(get_circuit(angle=pi / 4 + 1e-12), [0, 1], 3, 8) != key
+    assert StatevectorCache.get_key(get_circuit(), [0], 3, 8) != key
+    assert StatevectorCache.get_key(get_circuit(), [1], 3, 8) != key
+    assert StatevectorCache.get_key(get_circuit(), [0, 1], 4, 8) != key
+    assert StatevectorCache.get_key(get_circuit(), [0, 1], 3, 9) != key
+
+    circuit = get_circuit()
+    circuit.global_phase = pi / 2
+    assert StatevectorCache.get_key(circuit, [0, 1], 3, 8) != key
+
+
+def test_disk_store(tmp_path):
+    value = get_value(1)
+    StatevectorCache(cache_dir=tmp_path).put("a", value)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.npz"]
+
+    # A new cache, e.g. in another process, reads the entry from disk
+    cache = StatevectorCache(cache_dir=tmp_path)
+    cached = cache.get("a")
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cached[0] == value[0]
+    np.testing.assert_array_equal(cached[1], value[1])
+
+
+def test_disk_store_is_atomic(tmp_path, monkeypatch):
+    value = get_value(1)
+    cache = StatevectorCache(cache_dir=tmp_path)
+    cache.put("a", value)
+
+    def failing_savez(path, **arrays):
+        with open(path, "wb") as file:
+            file.write(b"partial")
+        raise OSError("disk full")
+
+    # A write that fails halfway leaves the stored entry intact
+    monkeypatch.setattr(fractal_statevector_cache.np, "savez", failing_savez)
+    with pytest.raises(OSError):
+        cache.put("a", get_value(2))
+    monkeypatch.undo()
+
+    cached = StatevectorCache(cache_dir=tmp_path).get("a")
+    assert cached[0] == value[0]
+    np.testing.assert_array_equal(cached[1], value[1])
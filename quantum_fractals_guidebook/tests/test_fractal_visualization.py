@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Import externally installed libraries
+import numpy as np
+import pytest
+
+# Import project-modules
+from quantum_fractals_guidebook.utils.fractal_bloch import BlochRenderer
+from quantum_fractals_guidebook.utils.fractal_julia_arrays import GetJuliaArrays
+from quantum_fractals_guidebook.utils.fractal_julia_batch import render_frames
+from quantum_fractals_guidebook.utils.fractal_quantum_circuit import FractalQuantumCircuit
+from quantum_fractals_guidebook.utils.fractal_render import get_bell_u_circuit
+from quantum_fractals_guidebook.utils.fractal_visualization import QuantumFractalVisualization
+
+pytest.importorskip("qiskit")
+pytest.importorskip("matplotlib").use("Agg")
+
+
+def test_qf_interactive_animation():
+    julia_arrays = GetJuliaArrays(300, 0.0, 1.5, 0.0, 1.5, 64, 64)
+    z = julia_arrays.get_z_array()
+    con = julia_arrays.get_converging_array()
+    con[:8] = False
+    div = julia_arrays.get_diverged_array()
+    div[:8] = 7
+
+    quantum_circuit = get_bell_u_circuit()
+    visualization = QuantumFractalVisualization(bloch_renderer=BlochRenderer(size=64))
+    animation = visualization.qf_interactive_animation(quantum_circuit, 4, z, con, div, *julia_arrays.shape, 200,
+                                                       max_iterations=julia_arrays.julia_iterations)
+    # Only frame 1 is drawn, marked as rendered so matplotlib does not warn when the animation is deleted
+    animation._draw_was_started = True
+    animation._func(1)
+
+    # The maps use the iteration budget of the caller and keep the pixels of div that con leaves out
+    statevector_new, _, statevector = FractalQuantumCircuit(2, quantum_circuit, 4).get_quantum_circuit(frame_iteration=1)
+    for axis, equation, c in zip(animation._fig.axes[1:], ("1cn0", "2cn1", "2cn2"),
+                                 (statevector_new, statevector, statevector)):
+        expected = render_frames([c], z, equation, julia_arrays.julia_iterations)[0]
+        expected[:8] = 7
+        np.testing.assert_array_equal(axis.images[0].get_array(), expected)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from collections import OrderedDict
+from pathlib import Path
+from math import radians, sin, cos
+from typing import List, Tuple
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+from PIL import Image, ImageDraw, ImageFont
+
+# Colors matching the Bloch sphere of <qiskit.visualization.plot_bloch_multivector>
+SPHERE_COLOR = (255, 221, 221, 60)
+FRAME_COLOR = (128, 128, 128, 255)
+HIDDEN_COLOR = (128, 128, 128, 90)
+VECTOR_COLOR = (220, 38, 127, 255)
+FONT_PATH = Path(Path(__file__).resolve().parent.parent, "static", "fonts", "IBMPlexMono-SemiBold.ttf")
+
+
+def get_bloch_vectors(statevector: ndarray) -> ndarray:
+    """Returns the (x, y, z) Bloch vector of each qubit of a pure n-qubit statevector, ordered as in Qiskit"""
+    statevector = np.asarray(statevector, dtype=np.complex128)
+    number_of_qubits = int(np.log2(len(statevector)))
+
+    # Qiskit orders the basis states little-endian, so qubit q is axis n - 1 - q of the reshaped tensor
+    tensor = statevector.reshape((2,) * number_of_qubits)
+    bloch_vectors = np.empty((number_of_qubits, 3))
+    for qubit in range(number_of_qubits):
+        amplitudes = np.moveaxis(tensor, number_of_qubits - 1 - qubit, 0).reshape(2, -1)
+        rho = amplitudes @ amplitudes.conj().T
+        bloch_vectors[qubit] = 2 * rho[0, 1].real, 2 * rho[1, 0].imag, (rho[0, 0] - rho[1, 1]).real
+    return bloch_vectors
+
+
+class BlochRenderer:
+    """
+    Renders Bloch spheres as raw RGBA arrays without matplotlib. The static sphere is drawn once, after which
+    each frame only draws the state vector onto a copy of it. Rendered spheres are cached by their Bloch vector
+    rounded to <decimals>, so the repeating rotations of an animation are only drawn once.
+    """
+    def __init__(self, size: int = 300, azimuth: float = -60, elevation: float = 30, decimals: int = 3,
+                 max_entries: int = 1024) -> None:
+        self.size = size
+        self.decimals = decimals
+        self.max_entries = max_entries
+        self.cache: "OrderedDict[Tuple[float, float, float], ndarray]" = OrderedDict()
+
+        # Orthographic camera with the same view angles as the 3D axes of matplotlib
+        azimuth, elevation = radians(azimuth), radians(elevation)
+        self.right = np.array([-sin(azimuth), cos(azimuth), 0.0])
+        self.up = np.array([-sin(elevation) * cos(azimuth), -sin(elevation) * sin(azimuth), cos(elevation)])
+        self.eye = np.array([cos(elevation) * cos(azimuth), cos(elevation) * sin(azimuth), sin(elevation)])
+        self.radius = 0.36 * size
+
+        try:
+            self.font = ImageFont.truetype(str(FONT_PATH), size=max(10, size // 16))
+        except OSError:
+            self.font = ImageFont.load_default()
+        self.sphere = self._draw_sphere()
+
+    def project(self, points: ndarray) -> ndarray:
+        """Projects Bloch coordinates (..., 3) onto pixel coordinates (..., 2)"""
+        # Like Qiskit, the x and y coordinates are switched (and x negated) before plotting
+        points = np.stack([points[..., 1], -points[..., 0], points[..., 2]], axis=-1)
+        center = self.size / 2
+        return np.stack([center + self.radius * points @ self.right, center - self.radius * points @ self.up], axis=-1)
+
+    def get_depth(self, points: ndarray) -> ndarray:
+        """Positive for points on the half of the sphere facing the viewer"""
+        points = np.stack([points[..., 1], -points[..., 0], points[..., 2]], axis=-1)
+        return points @ self.eye
+
+    def _draw_circle(self, draw: ImageDraw.ImageDraw, points: ndarray) -> None:
+        """Draws a great circle, where the half behind the sphere is drawn fainter"""
+        pixels, depths = self.project(points), self.get_depth(points)
+        for index in range(len(points) - 1):
+            color = FRAME_COLOR if depths[index] >= 0 else HIDDEN_COLOR
+            draw.line([tuple(pixels[index]), tuple(pixels[index + 1])], fill=color, width=1)
+
+    def _draw_sphere(self) -> Image.Image:
+        image = Image.new("RGBA", (self.size, self.size), (255, 255, 255, 255))
+        overlay = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        # Silhouette and the shaded sphere
+        center = self.size / 2
+        draw.ellipse([center - self.radius, center - self.radius, center + self.radius, center + self.radius],
+                     fill=SPHERE_COLOR, outline=FRAME_COLOR, width=1)
+
+        # Equator and the two meridians through the x and y axes
+        angles = np.linspace(0, 2 * np.pi, 121)
+        zeros = np.zeros_like(angles)
+        self._draw_circle(draw, np.stack([np.cos(angles), np.sin(angles), zeros], axis=-1))
+        self._draw_circle(draw, np.stack([np.cos(angles), zeros, np.sin(angles)], axis=-1))
+        self._draw_circle(draw, np.stack([zeros, np.cos(angles), np.sin(angles)], axis=-1))
+
+        # Axes and their labels
+        for axis, label in ((np.eye(3)[0], "x"), (np.eye(3)[1], "y"), (np.eye(3)[2], "|0>"), (-np.eye(3)[2], "|1>")):
+            start, end = self.project(np.stack([-axis, axis]))
+            draw.line([tuple(start), tuple(end)], fill=HIDDEN_COLOR, width=1)
+            label_x, label_y = self.project(axis * 1.2)
+            draw.text((label_x, label_y), label, fill=(0, 0, 0, 255), font=self.font, anchor="mm")
+
+        return Image.alpha_composite(image, overlay)
+
+    def render_vector(self, bloch_vector: ndarray) -> ndarray:
+        """Returns a (size, size, 4) uint8 RGBA image of a single Bloch sphere with its state vector"""
+        key = tuple(np.round(bloch_vector, self.decimals) + 0.0)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        image = self.sphere.copy()
+        draw = ImageDraw.Draw(image)
+        origin, tip = self.project(np.array([[0.0, 0.0, 0.0], key]))
+        draw.line([tuple(origin), tuple(tip)], fill=VECTOR_COLOR, width=max(2, self.size // 60))
+
+        # Arrow head pointing along the projected vector, skipped when the vector points at the viewer
+        direction = tip - origin
+        length = np.hypot(*direction)
+        if length > 1e-6:
+            direction, normal = direction / length, np.array([-direction[1], direction[0]]) / length
+            head = self.size / 30
+            base = tip - direction * head
+            draw.polygon([tuple(tip), tuple(base + normal * head / 2), tuple(base - normal * head / 2)],
+                         fill=VECTOR_COLOR)
+
+        rgba = np.asarray(image)
+        self.cache[key] = rgba
+        while len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return rgba
+
+    def render(self, statevector: ndarray) -> ndarray:
+        """Returns the Bloch spheres of all qubits of the statevector side by side as one RGBA array"""
+        spheres: List[ndarray] = [self.render_vector(vector) for vector in get_bloch_vectors(statevector)]
+        return spheres[0] if len(spheres) == 1 else np.concatenate(spheres, axis=1)
+
+    def render_circuit(self, quantum_circuit) -> ndarray:
+        """Same as <render>, but for the statevector of a quantum circuit"""
+        from qiskit.quantum_info import Statevector
+        return self.render(Statevector(quantum_circuit).data)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+
+
+@lru_cache(maxsize=16)
+def get_colormap_lut(cmap: str = "magma", size: int = 256) -> ndarray:
+    """
+    Returns a read-only (size, 3) uint8 lookup table of a matplotlib colormap. Matplotlib is only needed to
+    build the table once, e.g. size=65536 maps every uint16 escape-time value to its own color.
+    """
+    from matplotlib import colormaps
+    lut = colormaps[cmap].resampled(size)(np.arange(size))[:, :3]
+    lut = np.round(lut * 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def colorize(div: ndarray, cmap: str = "magma", vmin: Union[int, None] = None, vmax: Union[int, None] = None,
+             lut_size: int = 256) -> ndarray:
+    """
+    Turns an escape-time array into a (height, width, 3) uint8 RGB image, scaled like imshow(div, cmap=cmap)
+    between vmin and vmax, which default to the minimum and maximum of div. Integer arrays are mapped through
+    a table with one entry per value between vmin and vmax, so each pixel costs a single lookup.
+    """
+    lut = get_colormap_lut(cmap, lut_size)
+    vmin = div.min() if vmin is None else vmin
+    vmax = div.max() if vmax is None else vmax
+
+    def get_indices(values: ndarray) -> ndarray:
+        # Same binning as matplotlib: values are normalized to [0, 1] and split into lut_size equal bins
+        if vmax == vmin:
+            return np.zeros(values.shape, dtype=np.intp)
+        scaled = (values.astype(np.float64) - vmin) / (vmax - vmin) * lut_size
+        return np.clip(scaled, 0, lut_size - 1).astype(np.intp)
+
+    if np.issubdtype(div.dtype, np.integer):
+        lower, upper = int(min(vmin, div.min())), int(max(vmax, div.max()))
+        table = lut[get_indices(np.arange(lower, upper + 1))]
+        return table[div.astype(np.intp, copy=False) - lower]
+    return lut[get_indices(div)]
+
+
+def resize_nearest(image: ndarray, height: int) -> ndarray:
+    """Scales an image to the given height with nearest-neighbour sampling, keeping its aspect ratio"""
+    if image.shape[0] == height:
+        return image
+    width = max(1, round(image.shape[1] * height / image.shape[0]))
+    rows = (np.arange(height) * image.shape[0] // height)
+    cols = (np.arange(width) * image.shape[1] // width)
+    return image[rows[:, None], cols[None, :]]
+
+
+def to_rgb(image: ndarray, background: Tuple[int, int, int] = (255, 255, 255)) -> ndarray:
+    """Drops the alpha channel of an RGBA uint8 image by compositing it onto the background color"""
+    if image.shape[-1] == 3:
+        return image
+    alpha = image[..., 3:4].astype(np.uint16)
+    rgb = (image[..., :3] * alpha + np.array(background, dtype=np.uint16) * (255 - alpha) + 127) // 255
+    return rgb.astype(np.uint8)
+
+
+def compose_frame(panels: Sequence[ndarray], cmap: str = "magma", height: Union[int, None] = None, gap: int = 0,
+                  background: Tuple[int, int, int] = (255, 255, 255)) -> ndarray:
+    """
+    Tiles the panels of a frame, e.g. the Bloch sphere image and the Julia Set escape-time arrays, side by side
+    into one (height, width, 3) uint8 RGB image without creating a matplotlib figure. 2D panels are colorized
+    with cmap, RGB(A) panels are used as they are, and all panels are scaled to the height of the tallest one.
+    """
+    images = [colorize(panel, cmap) if panel.ndim == 2 else to_rgb(panel, background) for panel in panels]
+    height = height or max(image.shape[0] for image in images)
+    images = [resize_nearest(image, height) for image in images]
+
+    width = sum(image.shape[1] for image in images) + gap * (len(images) - 1)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[...] = background
+    col = 0
+    for image in images:
+        frame[:, col:col + image.shape[1]] = image
+        col += image.shape[1] + gap
+    return frame
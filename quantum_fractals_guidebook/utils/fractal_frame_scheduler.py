@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context, shared_memory
+from collections import deque
+from time import perf_counter
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, NamedTuple, Sequence, Tuple, Union
+import os
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+from numba import set_num_threads
+
+# Import project-modules
+from .fractal_julia_arrays import GetJuliaArrays
+from .fractal_julia_batch import render_frames
+from .fractal_profiling import Profiler, StageRecord
+from .fractal_quantum_circuit import FractalQuantumCircuit
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+
+class FrameResult(NamedTuple):
+    frame: int
+    julia: ndarray                  # (len(equations), height, width) escape-time maps
+    statevector_new: complex        # The single complex number used by 1cn0
+    statevector: ndarray            # The statevector used by 2cn1, 2cn2 and general
+    timings: Dict[str, float]       # Seconds spent per stage, where 'total' includes the transfer between processes
+    records: Tuple[StageRecord, ...] = ()   # Stages recorded by the worker when profiling
+
+
+# State of each worker process, set once by <_init_worker>
+# ───────────────────────────────────────────────────────────
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, int], z_dtype: str, div_dtype: str, quantum_circuit: "QuantumCircuit",
+                 number_of_frames: int, numba_threads: int, profile: bool) -> None:
+    set_num_threads(numba_threads)
+
+    # Attach to the grid in shared memory, the SharedMemory object must outlive the array referring to it
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["z"] = np.ndarray(shape, dtype=z_dtype, buffer=shm.buf)
+    _worker["div_dtype"] = div_dtype
+    _worker["profiler"] = Profiler() if profile else None
+    _worker["circuit"] = FractalQuantumCircuit(number_of_qubits=quantum_circuit.num_qubits,
+                                               quantum_circuit=quantum_circuit,
+                                               total_number_of_frames=number_of_frames, profiler=_worker["profiler"])
+
+
+def _render_frame(frame: int, rotate: str, equations: Tuple[str, ...], max_iterations: int, escape_number: int,
+                  power_offset: int) -> FrameResult:
+    timings = {}
+    profiler = _worker["profiler"]
+
+    start = perf_counter()
+    statevector_new, _, statevector = _worker["circuit"].get_quantum_circuit(rotate=rotate, frame_iteration=frame)
+    timings["circuit"] = perf_counter() - start
+
+    start = perf_counter()
+    z = _worker["z"]
+    julia = np.empty((len(equations),) + z.shape, dtype=_worker["div_dtype"])
+    for index, equation in enumerate(equations):
+        c_values = [statevector_new] if equation == "1cn0" else [statevector]
+        render_frames(c_values, z, equation, max_iterations, escape_number, power_offset, out=julia[index:index + 1],
+                      profiler=profiler, frame=frame)
+    timings["julia"] = perf_counter() - start
+
+    # The records of this frame are sent back with the result, so the worker keeps none of them
+    records = ()
+    if profiler is not None:
+        records = tuple(profiler.records)
+        profiler.clear()
+    return FrameResult(frame, julia, complex(statevector_new), statevector, timings, records)
+
+
+# ───────────────────────────────────────────────────────────
+def render_animation(quantum_circuit: "QuantumCircuit", julia_arrays: GetJuliaArrays, number_of_frames: int = 60,
+                     rotate: str = "first", equations: Sequence[str] = ("1cn0", "2cn1", "2cn2"),
+                     workers: Union[int, None] = None, escape_number: int = 2,
+                     power_offset: int = 0, profiler: Union[Profiler, None] = None) -> Iterator[FrameResult]:
+    """
+    Renders the frames of an animation in a pool of worker processes and yields them in frame order, so the
+    results can be fed directly into the GIF or video assembly. Each worker simulates the quantum circuit and
+    runs the Julia kernels for its frames, while the complex grid is shared between the workers through shared
+    memory instead of being copied into each of them. The Numba threads are divided between the workers.
+
+    At most two frames per worker are in flight, which bounds the memory used by frames waiting to be consumed.
+    With a profiler, the stages recorded in the workers are added to it as their frames arrive.
+    """
+    workers = workers or os.cpu_count() or 1
+    numba_threads = max(1, (os.cpu_count() or 1) // workers)
+    equations = tuple(equations)
+
+    z = julia_arrays.get_z_array()
+    shm = shared_memory.SharedMemory(create=True, size=z.nbytes)
+    try:
+        np.ndarray(z.shape, dtype=z.dtype, buffer=shm.buf)[...] = z
+        init_args = (shm.name, z.shape, julia_arrays.z_dtype, julia_arrays.div_dtype, quantum_circuit,
+                     number_of_frames, numba_threads, profiler is not None)
+
+        # Spawned workers avoid forking a process in which the Numba threading layer may already be running
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"), initializer=_init_worker,
+                                 initargs=init_args) as executor:
+            pending: Deque[Tuple[Future, float]] = deque()
+            frames = iter(range(number_of_frames))
+            for frame in frames:
+                pending.append((executor.submit(_render_frame, frame, rotate, equations, julia_arrays.julia_iterations,
+                                                escape_number, power_offset), perf_counter()))
+                if len(pending) >= 2 * workers:
+                    break
+
+            while pending:
+                future, submitted = pending.popleft()
+                result = future.result()
+                result.timings["total"] = perf_counter() - submitted
+                if profiler is not None:
+                    profiler.extend(list(result.records))
+                frame = next(frames, None)
+                if frame is not None:
+                    pending.append((executor.submit(_render_frame, frame, rotate, equations,
+                                                    julia_arrays.julia_iterations, escape_number, power_offset),
+                                    perf_counter()))
+                yield result
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import NamedTuple, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import int64, ndarray
+
+# Import project-modules
+from .fractal_julia_arrays import GetJuliaArrays
+from .fractal_julia_batch import render_frame
+
+
+class AdaptiveBudget(NamedTuple):
+    max_iterations: int
+    preview_iterations: int     # Budget of the last preview pass
+    escaped_fraction: float     # Fraction of preview pixels that escaped within preview_iterations
+    ambiguous_fraction: float   # Fraction of escaped preview pixels that needed the last 10% of the preview budget
+
+
+def choose_iterations(preview: ndarray, preview_iterations: int, percentile: float = 99.5, headroom: float = 1.5,
+                      min_iterations: int = 20) -> int:
+    """
+    Picks the iteration budget from the escape-time histogram of a preview: the given percentile of the escape
+    times of the escaped pixels, times some headroom for the extra detail at full resolution.
+    """
+    escaped = preview[preview < preview_iterations - 1]
+    if escaped.size == 0:
+        return min_iterations
+    return max(min_iterations, int(np.ceil(np.percentile(escaped, percentile) * headroom)) + 1)
+
+
+def get_adaptive_budget(julia_arrays: GetJuliaArrays, c: Union[complex, ndarray], equation: str = "1cn0",
+                        preview_scale: int = 4, preview_iterations: int = 64, max_iterations: int = 4096,
+                        ambiguous_threshold: float = 0.01, escape_number: float = 2,
+                        power_offset: int64 = 0) -> AdaptiveBudget:
+    """
+    Renders a preview at 1/preview_scale of the resolution of julia_arrays and derives the iteration budget
+    of the full resolution pass from its escape-time histogram. While more than ambiguous_threshold of the
+    escaped pixels escape in the last 10% of the preview budget, the interior is ambiguous, i.e. slowly escaping
+    pixels are mistaken for interior, and the preview is repeated with twice the budget, up to max_iterations.
+    The escape number is used as given for the preview and the full resolution pass.
+    """
+    preview_arrays = GetJuliaArrays(preview_iterations, julia_arrays.x_start, julia_arrays.x_width,
+                                    julia_arrays.y_start, julia_arrays.y_width,
+                                    max(2, int(julia_arrays.height) // preview_scale),
+                                    max(2, int(julia_arrays.width) // preview_scale), julia_arrays.zoom)
+    z = preview_arrays.get_z_array()
+
+    while True:
+        preview = render_frame(c, z, equation, preview_iterations, escape_number, power_offset)
+        escaped = preview < preview_iterations - 1
+        late = preview >= int(0.9 * preview_iterations)
+        escaped_fraction = float(escaped.mean())
+        ambiguous_fraction = float((escaped & late).sum() / max(1, escaped.sum()))
+        if ambiguous_fraction <= ambiguous_threshold or preview_iterations >= max_iterations:
+            break
+        preview_iterations = min(max_iterations, 2 * preview_iterations)
+
+    iterations = choose_iterations(preview, preview_iterations)
+    if ambiguous_fraction > ambiguous_threshold:
+        iterations = max(iterations, preview_iterations)
+    return AdaptiveBudget(min(iterations, max_iterations), preview_iterations, escaped_fraction, ambiguous_fraction)
+
+
+def render_adaptive(julia_arrays: GetJuliaArrays, c: Union[complex, ndarray], equation: str = "1cn0",
+                    max_iterations: int = 4096, escape_number: float = 2,
+                    power_offset: int64 = 0) -> Tuple[ndarray, AdaptiveBudget]:
+    """Renders a frame at the full resolution of julia_arrays with the budget of <get_adaptive_budget>"""
+    budget = get_adaptive_budget(julia_arrays, c, equation, max_iterations=max_iterations, escape_number=escape_number,
+                                 power_offset=power_offset)
+    div = render_frame(c, julia_arrays.get_z_array(), equation, budget.max_iterations, escape_number, power_offset)
+    return div, budget
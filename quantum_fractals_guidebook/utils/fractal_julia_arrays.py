@@ -3,16 +3,50 @@
 # Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
 
 # Importing standard python libraries
-from typing import Union
+from typing import Dict, Tuple, Union
 
 # Import externally installed libraries
 import numpy as np
 
 
+# Supported precision modes, see <GetJuliaArrays>
+DIV_DTYPES: Tuple[str, ...] = ("uint8", "uint16", "int32", "int64")
+Z_DTYPES: Tuple[str, ...] = ("complex64", "complex128")
+
+
+def get_complex_grid(x_min: float, x_max: float, y_min: float, y_max: float, height: int, width: int,
+                     z_dtype: str = "complex128") -> np.ndarray:
+    """
+    Complex grid of the given bounds, resolution and precision. The grid is read-only, as <GetJuliaArrays> hands
+    it out to every caller, so a kernel writing to z fails instead of corrupting every later frame.
+    """
+    x_arr = np.linspace(start=x_min, stop=x_max, num=width).reshape((1, width))
+    y_arr = np.linspace(start=y_min, stop=y_max, num=height).reshape((height, 1))
+    grid = (x_arr + 1j * y_arr).astype(z_dtype, copy=False)
+    grid.flags.writeable = False
+    return grid
+
+
 class GetJuliaArrays:
     def __init__(self, julia_iterations: int = 100, x_start: Union[int, float] = 0.0, x_width: Union[int, float] = 1.5,
                  y_start: Union[int, float] = 0.0, y_width: Union[int, float] = 1.5, height: Union[int, float] = 500,
-                 width: Union[int, float] = 500, zoom: Union[int, float] = 1.0) -> None:
+                 width: Union[int, float] = 500, zoom: Union[int, float] = 1.0, div_dtype: str = "uint16",
+                 z_dtype: str = "complex128", track_convergence: bool = True) -> None:
+        """
+        Precision mode:
+            div_dtype:          'uint8' (up to 256 iterations), 'uint16', 'int32' or 'int64' escape-time arrays
+            z_dtype:            'complex128' or 'complex64', where the latter also requires c in complex64, see
+                                <cast_c>, to keep the kernels from promoting the arithmetic back to complex128
+            track_convergence:  if False, <get_converging_array> returns None, which the early-exit kernels
+                                accept in place of an all-True array
+        """
+        if div_dtype not in DIV_DTYPES:
+            raise ValueError(f"div_dtype must be one of {', '.join(DIV_DTYPES)}, got '{div_dtype}'")
+        if z_dtype not in Z_DTYPES:
+            raise ValueError(f"z_dtype must be one of {', '.join(Z_DTYPES)}, got '{z_dtype}'")
+        if julia_iterations - 1 > np.iinfo(div_dtype).max:
+            raise ValueError(f"{julia_iterations} iterations do not fit into the div_dtype '{div_dtype}'")
+
         self.julia_iterations = julia_iterations
         self.x_start = x_start
         self.x_width = x_width
@@ -21,21 +55,67 @@ class GetJuliaArrays:
         self.height = height
         self.width = width
         self.zoom = zoom
+        self.div_dtype = div_dtype
+        self.z_dtype = z_dtype
+        self.track_convergence = track_convergence
 
-    def get_z_array(self) -> np.ndarray:
+        # Preallocated output buffers handed out by <get_output_buffer>
+        self.buffers: Dict[Tuple[str, int], np.ndarray] = {}
+        # The last grid of <get_z_array> with the bounds, resolution and precision it was computed for
+        self.grid: Union[np.ndarray, None] = None
+        self.grid_key: Union[Tuple, None] = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return int(self.height), int(self.width)
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """Returns x_min, x_max, y_min and y_max of the grid after zooming"""
         x_min: float = self.x_start - self.x_width / self.zoom
         x_max: float = self.x_start + self.x_width / self.zoom
         y_min: float = self.y_start - self.y_width / self.zoom
         y_max: float = self.y_start + self.y_width / self.zoom
+        return x_min, x_max, y_min, y_max
 
-        x_arr = np.linspace(start=x_min, stop=x_max, num=self.width).reshape((1, self.width))
-        y_arr = np.linspace(start=y_min, stop=y_max, num=self.height).reshape((self.height, 1))
-        return x_arr + 1j * y_arr
+    def get_z_array(self) -> np.ndarray:
+        """
+        The complex grid is computed once per (bounds, zoom, resolution) and shared between all callers, so it
+        is read-only. The early-exit and fused kernels only read z, the original kernels need a copy. Only the
+        last grid is kept, so a zoom with a new window per frame holds a single grid at a time.
+        """
+        grid_key = (*self.get_bounds(), *self.shape, self.z_dtype)
+        if grid_key != self.grid_key:
+            self.grid, self.grid_key = get_complex_grid(*grid_key), grid_key
+        return self.grid
 
     def get_diverged_array(self) -> np.ndarray:
         """To keep track in which iteration the point diverged"""
-        return np.full(self.get_z_array().shape, self.julia_iterations - 1, dtype='int64')
+        return np.full(self.shape, self.julia_iterations - 1, dtype=self.div_dtype)
 
-    def get_converging_array(self) -> np.ndarray:
+    def get_converging_array(self) -> Union[np.ndarray, None]:
         """To keep track on which points did not converge so far"""
-        return np.full(self.get_z_array().shape, True, dtype=np.bool_)
\ No newline at end of file
+        if not self.track_convergence:
+            return None
+        return np.full(self.shape, True, dtype=np.bool_)
+
+    def cast_c(self, c: Union[complex, np.ndarray]) -> Union[np.complexfloating, np.ndarray]:
+        """Returns the complex number or statevector c in the precision of the z array"""
+        if np.ndim(c) == 0:
+            return np.dtype(self.z_dtype).type(c)
+        return np.ascontiguousarray(c, dtype=self.z_dtype)
+
+    def get_output_buffer(self, name: str = "div", layers: int = 0, reset: bool = False) -> np.ndarray:
+        """
+        Returns a div_dtype buffer of shape (height, width), or (layers, height, width) for the fused and batched
+        kernels, that is allocated on the first request and reused by every later one. Each name refers to its
+        own buffer, so use one name per kernel whose output is needed at the same time. The fused and batched
+        kernels write every pixel, other kernels only the escaped ones and need reset=True, which fills the
+        buffer with julia_iterations - 1 like <get_diverged_array>.
+        """
+        shape = ((layers,) if layers else ()) + self.shape
+        buffer = self.buffers.get((name, layers))
+        if buffer is None or buffer.shape != shape:
+            buffer = self.buffers[(name, layers)] = np.empty(shape, dtype=self.div_dtype)
+        if reset:
+            buffer.fill(self.julia_iterations - 1)
+        return buffer
\ No newline at end of file
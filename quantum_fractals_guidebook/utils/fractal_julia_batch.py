@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+#############################################################
+from itertools import product
+from typing import Dict, List, Tuple, Union
+from numpy import uint8, uint16, int64, empty, stack, asarray, ndim, complex_, complex128, ndarray
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
+
+# Import project-modules
+from .fractal_julia_calculations import get_escape_bound, get_grid_types
+from .fractal_julia_equations import escape_time
+from .fractal_julia_coefficients import get_equation_id, get_equation_coefficients
+from .fractal_profiling import Profiler, profile_stage, get_pixel_iterations
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_frames(equation: uint8, coefficients: ndarray[complex_, complex_], z: ndarray[complex_, complex_],
+               div: ndarray, max_iterations: uint16 = 100,
+               escape_number: uint8 = 2) -> ndarray:
+    """
+    Renders all frames of an animation in one parallel region, where coefficients holds one row per frame.
+    The work is split over frames x rows, so every core stays busy even for small frames. Pixels that do not
+    escape are set to max_iterations - 1, the same value <GetJuliaArrays.get_diverged_array> starts with.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    frames = coefficients.shape[0]
+    height, width = z.shape
+    for index in prange(frames * height):
+        frame, row = index // height, index % height
+        coef = coefficients[frame]
+        for col in range(width):
+            j = escape_time(equation, z[row, col], coef, max_iterations, escape_number, escape_bound)
+            div[frame, row, col] = j if j >= 0 else max_iterations - 1
+    return div
+
+
+def render_frames(c_values: Union[List, ndarray], z: ndarray[complex_, complex_], equation: str = "1cn0",
+                  max_iterations: uint16 = 100, escape_number: uint8 = 2, power_offset: int64 = 0,
+                  out: Union[ndarray, None] = None, dtype: str = "uint16",
+                  profiler: Union[Profiler, None] = None, frame: Union[int, None] = None) -> ndarray:
+    """
+    Returns a (frames, height, width) stack of escape-time maps of the given dtype for the grid z, where c_values
+    has the shape (frames,) with one complex number per frame (1cn0) or (frames, 2^n) with one statevector per
+    frame. The stack is written into out when given, e.g. a buffer from <GetJuliaArrays.get_output_buffer>.
+    A complex64 grid z is iterated in complex64, as the coefficients are cast to the precision of z.
+    With a profiler, the kernel is recorded as the stage 'julia.<equation>' of the given frame, including its
+    pixel-iterations.
+    """
+    equation_id = get_equation_id(equation)
+    c_values = asarray(c_values, dtype=complex_)
+    if c_values.ndim == 1:
+        c_values = c_values.reshape(-1, 1)
+
+    coefficients = stack([get_equation_coefficients(equation_id, c, power_offset) for c in c_values]).astype(z.dtype)
+    div = empty((len(coefficients),) + z.shape, dtype=dtype) if out is None else out
+    with profile_stage(profiler, f"julia.{equation}", frame) as stats:
+        set_frames(equation_id, coefficients, z, div, max_iterations, escape_number)
+        if profiler is not None:
+            stats["pixel_iterations"] = get_pixel_iterations(div)
+    return div
+
+
+def render_frame(c: Union[complex, ndarray], z: ndarray[complex_, complex_], equation: str = "1cn0",
+                 max_iterations: uint16 = 100, escape_number: uint8 = 2, power_offset: int64 = 0,
+                 dtype: str = "uint16") -> ndarray:
+    """The (height, width) escape-time map of <render_frames> for a single complex number or statevector c"""
+    c_values = [c] if ndim(c) == 0 else [asarray(c)]
+    return render_frames(c_values, z, equation, max_iterations, escape_number, power_offset, dtype=dtype)[0]
+
+
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = (uint8, uint16),
+                          z_dtypes: Tuple[type, ...] = (complex128,)) -> Dict[Dispatcher, List[tuple]]:
+    """Returns the argument types of <set_frames> as called by <render_frames> with a writable or read-only grid"""
+    signatures = {set_frames: []}
+    for z_dtype in z_dtypes:
+        for grid_type, div_dtype in product(get_grid_types(z_dtype), div_dtypes):
+            arrays = (from_dtype(z_dtype)[:, ::1], grid_type, from_dtype(div_dtype)[:, :, ::1])
+            signatures[set_frames].append((types.int64,) + arrays + (types.int64, types.int64))
+    return signatures
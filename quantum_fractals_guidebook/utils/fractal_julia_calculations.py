@@ -3,14 +3,18 @@
 # Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
 
 #############################################################
-from numpy import uint8, uint16, bool_, complex_, ndarray
-from numba import jit, prange
+from itertools import product
+from typing import Dict, List, NamedTuple, Tuple, Union
+from numpy import uint8, uint16, int32, int64, bool_, complex_, complex128, ndarray, zeros, arange
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
 
 
-@jit(nopython=True, cache=False, parallel=True, error_model='numpy')
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
 def set_1cn0(c: complex_, z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
              div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
-             height: uint16 = 200, width: uint16 = 200,) -> ndarray[uint16, uint16]:
+             height: uint16 = 200, width: uint16 = 200,
+             stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
     for x in prange(width):
         for y in prange(height):
             for j in range(max_iterations):
@@ -19,13 +23,19 @@ def set_1cn0(c: complex_, z: ndarray[complex_, complex_], con: ndarray[bool_, bo
                     if abs(z[x, y]) > escape_number:
                         con[x, y] = False
                         div[x, y] = j
+                        if stats is not None:
+                            stats[x, j] += 1
+            if stats is not None:
+                if con[x, y]:
+                    stats[x, max_iterations] += 1
     return div
 
 
-@jit(nopython=True, cache=False, parallel=True, error_model='numpy')
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
 def set_2cn1(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
              div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
-             height: uint16 = 200, width: uint16 = 200,) -> ndarray[uint16, uint16]:
+             height: uint16 = 200, width: uint16 = 200,
+             stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
     for x in prange(width):
         for y in prange(height):
             for j in range(max_iterations):
@@ -34,13 +44,19 @@ def set_2cn1(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[
                     if abs(z[x, y]) > escape_number:
                         con[x, y] = False
                         div[x, y] = j
+                        if stats is not None:
+                            stats[x, j] += 1
+            if stats is not None:
+                if con[x, y]:
+                    stats[x, max_iterations] += 1
     return div
 
 
-@jit(nopython=True, cache=False, parallel=True, error_model='numpy')
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
 def set_2cn2(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
              div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
-             height: uint16 = 200, width: uint16 = 200,) -> ndarray[uint16, uint16]:
+             height: uint16 = 200, width: uint16 = 200,
+             stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
     for x in prange(width):
         for y in prange(height):
             for j in range(max_iterations):
@@ -49,4 +65,242 @@ def set_2cn2(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[
                     if abs(z[x, y]) > escape_number:
                         con[x, y] = False
                         div[x, y] = j
+                        if stats is not None:
+                            stats[x, j] += 1
+            if stats is not None:
+                if con[x, y]:
+                    stats[x, max_iterations] += 1
+    return div
+
+
+# Early-exit escape-time kernels
+# ───────────────────────────────────────────────────────────
+# Drop-in replacements for the kernels above returning identical <div> arrays. Each pixel is iterated in a
+# local variable and abandoned as soon as it escapes, so <z> and <con> are only read and never written to,
+# and <con> may be None when convergence is not tracked (see <GetJuliaArrays>).
+# The magnitude test compares |z|² against a bound just below escape_number² and only falls back to abs()
+# for the few values close to the escape radius, which keeps the result bit-identical to abs(z) > escape.
+@jit(nopython=True, cache=True, error_model='numpy')
+def step_1cn0(z: complex_, c: complex_) -> complex_:
+    """z = z^2 + c"""
+    return z * z + c
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def step_2cn1(z: complex_, c0: complex_, c1: complex_) -> complex_:
+    """z = (z^2 + c[0]) / (z^2 + c[1])"""
+    z2 = z * z
+    return (z2 + c0) / (z2 + c1)
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def step_2cn2(z: complex_, c0: complex_, c1: complex_) -> complex_:
+    """z = (c[0] * z^2 + 1 - c[0]) / (c[1] * z^2 + 1 - c[1])"""
+    z2 = z * z
+    return (c0 * z2 + 1 - c0) / (c1 * z2 + 1 - c1)
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def has_escaped(z: complex_, escape_number: uint8, escape_bound: float) -> bool_:
+    """Equivalent to abs(z) > escape_number, where escape_bound is slightly below escape_number^2"""
+    return z.real * z.real + z.imag * z.imag > escape_bound and abs(z) > escape_number
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def get_escape_bound(escape_number: uint8) -> float:
+    """Squared escape radius lowered by a relative margin far larger than the rounding error of |z|^2"""
+    return escape_number * escape_number * (1.0 - 1e-9)
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_1cn0_fast(c: complex_, z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
+                  div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
+                  height: uint16 = 200, width: uint16 = 200,
+                  stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
+    escape_bound = get_escape_bound(escape_number)
+    for x in prange(width):
+        for y in range(height):
+            if con is not None:
+                if not con[x, y]:
+                    continue
+            z_val = z[x, y]
+            for j in range(max_iterations):
+                z_val = step_1cn0(z_val, c)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[x, y] = j
+                    if stats is not None:
+                        stats[x, j] += 1
+                    break
+            else:
+                if stats is not None:
+                    stats[x, max_iterations] += 1
+    return div
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_2cn1_fast(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
+                  div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
+                  height: uint16 = 200, width: uint16 = 200,
+                  stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
+    escape_bound = get_escape_bound(escape_number)
+    c0, c1 = c[0], c[1]
+    for x in prange(width):
+        for y in range(height):
+            if con is not None:
+                if not con[x, y]:
+                    continue
+            z_val = z[x, y]
+            for j in range(max_iterations):
+                z_val = step_2cn1(z_val, c0, c1)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[x, y] = j
+                    if stats is not None:
+                        stats[x, j] += 1
+                    break
+            else:
+                if stats is not None:
+                    stats[x, max_iterations] += 1
+    return div
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_2cn2_fast(c: ndarray[complex_], z: ndarray[complex_, complex_], con: ndarray[bool_, bool_],
+                  div: ndarray[uint16, uint16], max_iterations: uint16 = 100, escape_number: uint8 = 2,
+                  height: uint16 = 200, width: uint16 = 200,
+                  stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
+    escape_bound = get_escape_bound(escape_number)
+    c0, c1 = c[0], c[1]
+    for x in prange(width):
+        for y in range(height):
+            if con is not None:
+                if not con[x, y]:
+                    continue
+            z_val = z[x, y]
+            for j in range(max_iterations):
+                z_val = step_2cn2(z_val, c0, c1)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[x, y] = j
+                    if stats is not None:
+                        stats[x, j] += 1
+                    break
+            else:
+                if stats is not None:
+                    stats[x, max_iterations] += 1
     return div
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_fused(c: complex_, cn: ndarray[complex_], z: ndarray[complex_, complex_], div: ndarray,
+              max_iterations: uint16 = 100, escape_number: uint8 = 2, height: uint16 = 200,
+              width: uint16 = 200,) -> ndarray:
+    """
+    Computes the 1cn0 (c), 2cn1 and 2cn2 (cn) escape-time maps in a single pass over the grid and writes them to
+    div[0], div[1] and div[2] of a (3, height, width) array. Every pixel is written, where pixels that did not
+    escape get max_iterations - 1 like the array from <GetJuliaArrays.get_diverged_array>, so div can be reused
+    from frame to frame without resetting it.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    c0, c1 = cn[0], cn[1]
+    for x in prange(height):
+        for y in range(width):
+            z_start = z[x, y]
+            div[0, x, y] = div[1, x, y] = div[2, x, y] = max_iterations - 1
+
+            z_val = z_start
+            for j in range(max_iterations):
+                z_val = step_1cn0(z_val, c)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[0, x, y] = j
+                    break
+
+            z_val = z_start
+            for j in range(max_iterations):
+                z_val = step_2cn1(z_val, c0, c1)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[1, x, y] = j
+                    break
+
+            z_val = z_start
+            for j in range(max_iterations):
+                z_val = step_2cn2(z_val, c0, c1)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[2, x, y] = j
+                    break
+    return div
+
+
+# Iteration statistics
+# ───────────────────────────────────────────────────────────
+# The kernels above (and those of <fractal_julia_generalized>) optionally count escapes into a <stats> array
+# of shape (width, max_iterations + 1): stats[x, j] is the number of pixels of column x that escaped in
+# iteration j and stats[x, max_iterations] the number that never escaped. Every column is iterated by exactly
+# one thread of the prange loop, so the counters need neither atomics nor per-thread copies. Pixels with
+# con[x, y] False at the start are skipped by the kernels and not counted.
+class KernelStats(NamedTuple):
+    total_iterations: int
+    never_escaped: int
+    histogram: ndarray
+
+
+def get_stats_array(width: int, max_iterations: int) -> ndarray:
+    """Returns a zeroed <stats> array for the kernels, which can be reused after resetting it with fill(0)"""
+    return zeros((width, max_iterations + 1), dtype=int64)
+
+
+def get_kernel_stats(stats: ndarray) -> KernelStats:
+    """
+    Reduces a <stats> array filled by a kernel to the total number of iterations executed, the number of pixels
+    that never escaped and the escape-time histogram, where histogram[j] counts the pixels escaping in iteration
+    j and histogram[-1] those that never escaped. A pixel escaping in iteration j was iterated j + 1 times and a
+    pixel that never escaped max_iterations times.
+    """
+    histogram = stats.sum(axis=0)
+    max_iterations = len(histogram) - 1
+    total_iterations = int((histogram[:-1] * arange(1, max_iterations + 1)).sum() + histogram[-1] * max_iterations)
+    return KernelStats(total_iterations, int(histogram[-1]), histogram)
+
+
+# Explicit signatures used by <warmup> to precompile the kernels into the on-disk cache
+# ───────────────────────────────────────────────────────────
+DIV_DTYPES: Tuple[type, ...] = (uint8, uint16, int32, int64)
+Z_DTYPES: Tuple[type, ...] = (complex128,)
+
+
+def get_grid_types(z_dtype: type) -> Tuple[types.Array, types.Array]:
+    """The writable type of a 2D complex grid and the read-only type of the shared grid of <GetJuliaArrays>"""
+    z_type = from_dtype(z_dtype)
+    return z_type[:, ::1], types.Array(z_type, 2, "C", readonly=True)
+
+
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = DIV_DTYPES, z_dtypes: Tuple[type, ...] = Z_DTYPES,
+                          omit_con: bool = False) -> Dict[Dispatcher, List[tuple]]:
+    """
+    Returns the argument types of every kernel in this module for each <div> dtype. Two call shapes are covered:
+    all arguments given explicitly, and max_iterations/escape_number left at their defaults as in the notebooks.
+    The early-exit and fused kernels are also listed for every <z> dtype (with c in the same precision), for a
+    writable and a read-only grid and, if omit_con is True, with con=None. The original kernels write to z and
+    con and only support a writable complex128 grid.
+    """
+    signatures = {}
+    for kernel, scalar_c in ((set_1cn0, True), (set_2cn1, False), (set_2cn2, False),
+                             (set_1cn0_fast, True), (set_2cn1_fast, False), (set_2cn2_fast, False)):
+        early_exit = kernel in (set_1cn0_fast, set_2cn1_fast, set_2cn2_fast)
+        con_types = (types.boolean[:, ::1], types.none) if early_exit and omit_con else (types.boolean[:, ::1],)
+        signatures[kernel] = []
+        for z_dtype in z_dtypes if early_exit else (complex128,):
+            z_type = from_dtype(z_dtype)
+            grid_types = get_grid_types(z_dtype) if early_exit else get_grid_types(z_dtype)[:1]
+            for grid_type, con_type, div_dtype in product(grid_types, con_types, div_dtypes):
+                arrays = (z_type if scalar_c else z_type[::1], grid_type, con_type, from_dtype(div_dtype)[:, ::1])
+                signatures[kernel].append(arrays + (types.int64,) * 4 + (types.Omitted(None),))
+                signatures[kernel].append(arrays + (types.Omitted(100), types.Omitted(2), types.int64, types.int64,
+                                                    types.Omitted(None)))
+
+    signatures[set_fused] = []
+    for z_dtype in z_dtypes:
+        z_type = from_dtype(z_dtype)
+        for grid_type, div_dtype in product(get_grid_types(z_dtype), div_dtypes):
+            arrays = (z_type, z_type[::1], grid_type, from_dtype(div_dtype)[:, :, ::1])
+            signatures[set_fused].append(arrays + (types.int64, types.int64, types.int64, types.int64))
+            signatures[set_fused].append(arrays + (types.Omitted(100), types.Omitted(2), types.int64, types.int64))
+    return signatures
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+#############################################################
+from typing import Dict, Tuple, Union
+from numpy import int32, int64, linspace, log2, asarray, concatenate, zeros, complex_, ndarray
+
+# Coefficients of the Julia equations, kept free of Numba so that every engine can share them
+# ───────────────────────────────────────────────────────────
+def get_fraction_powers_and_indices(no_qubits: int64 = 1, power_offset: int64 = 0):
+    """Returns the powers and indices for any given amount of Qubits used in the <set_general> function"""
+    # Adjust the start and stop integer values for the powers
+    powers_start = 2 ** no_qubits // 2 + power_offset
+    powers_stop = 1 + power_offset
+
+    # Calculate all the evenly spaced specified intervals
+    upper_pwrs = linspace(start=powers_start, stop=powers_stop, num=2 ** no_qubits // 2).astype(int32)
+    upper_idxs = linspace(start=2 ** no_qubits - 2, stop=0, num=2 ** no_qubits // 2).astype(int32)
+    lower_pwrs = linspace(start=powers_start, stop=powers_stop, num=2 ** no_qubits // 2).astype(int32)
+    lower_idxs = linspace(start=2 ** no_qubits - 1,  stop=1, num=2 ** no_qubits // 2).astype(int32)
+
+    # Return
+    return upper_pwrs, upper_idxs, lower_pwrs, lower_idxs
+
+
+def get_fraction_coefficients(c: ndarray[complex_], upper_pwrs: ndarray[int32], upper_idxs: ndarray[int32],
+                              lower_pwrs: ndarray[int32], lower_idxs: ndarray[int32]) -> Tuple[ndarray, ndarray]:
+    """
+    Returns the dense polynomial coefficients (highest power first) of the numerator and denominator used in the
+    <set_general> equation for the statevector c. Only needs to be computed once per frame, after which both
+    polynomials can be evaluated with Horner's scheme in <set_general_horner>.
+    """
+    coefficients = []
+    for pwrs, idxs in ((upper_pwrs, upper_idxs), (lower_pwrs, lower_idxs)):
+        # The leading term z^pwrs[0] has no coefficient and the final term is the constant c[idxs[-1]]
+        coefficient = zeros(pwrs[0] + 1, dtype=complex_)
+        coefficient[0] = 1
+        for i in range(len(pwrs) - 1):
+            coefficient[pwrs[0] - pwrs[i + 1]] += c[idxs[i]]
+        coefficient[pwrs[0]] += c[idxs[-1]]
+        coefficients.append(coefficient)
+    return coefficients[0], coefficients[1]
+
+
+# Every Julia equation is identified by an integer inside the kernels and takes a 1D coefficient array:
+#   1cn0:    [c]                          z = z^2 + c
+#   2cn1:    [c[0], c[1]]                 z = (z^2 + c[0]) / (z^2 + c[1])
+#   2cn2:    [c[0], c[1]]                 z = (c[0] * z^2 + 1 - c[0]) / (c[1] * z^2 + 1 - c[1])
+#   general: [upper_coef, lower_coef]     n-qubit mating, see <get_fraction_coefficients>
+EQUATIONS: Dict[str, int] = {"1cn0": 0, "2cn1": 1, "2cn2": 2, "general": 3}
+
+
+def get_equation_id(equation: Union[str, int]) -> int:
+    """Returns the integer used by the kernels for an equation name such as '2cn1'"""
+    if isinstance(equation, str):
+        if equation.lower() not in EQUATIONS:
+            raise ValueError(f"Unknown equation '{equation}', expected one of {', '.join(EQUATIONS)}")
+        return EQUATIONS[equation.lower()]
+    return int(equation)
+
+
+def get_equation_coefficients(equation: Union[str, int], c: Union[complex, ndarray],
+                              power_offset: int64 = 0) -> ndarray:
+    """
+    Returns the 1D coefficient array of an equation for one frame, where c is the single complex number (1cn0)
+    or the statevector (2cn1, 2cn2 and general) as returned by <FractalQuantumCircuit.get_quantum_circuit>.
+    """
+    equation_id = get_equation_id(equation)
+    c = asarray(c, dtype=complex_).ravel()
+    if equation_id == EQUATIONS["1cn0"]:
+        return c[:1].copy()
+    if equation_id in (EQUATIONS["2cn1"], EQUATIONS["2cn2"]):
+        return c[:2].copy()
+
+    # Coefficients of the n-qubit mating, where n follows from the length of the statevector
+    number_of_qubits = int(log2(len(c)))
+    indices = get_fraction_powers_and_indices(no_qubits=number_of_qubits, power_offset=power_offset)
+    return concatenate(get_fraction_coefficients(c, *indices))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+#############################################################
+from numpy import uint8, uint16, int64, complex_, ndarray
+from numba import jit
+
+# Import project-modules
+from .fractal_julia_calculations import step_1cn0, step_2cn1, step_2cn2, has_escaped
+from .fractal_julia_generalized import step_general
+from .fractal_julia_coefficients import EQUATIONS, get_equation_id, get_equation_coefficients
+
+# The equation ids and coefficients moved to <fractal_julia_coefficients> and are re-exported for existing imports
+__all__ = ["step", "escape_time", "EQUATIONS", "get_equation_id", "get_equation_coefficients"]
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def step(equation: uint8, z: complex_, coef: ndarray[complex_]) -> complex_:
+    """Performs a single iteration of the given equation"""
+    if equation == 0:
+        return step_1cn0(z, coef[0])
+    elif equation == 1:
+        return step_2cn1(z, coef[0], coef[1])
+    elif equation == 2:
+        return step_2cn2(z, coef[0], coef[1])
+    half = coef.shape[0] // 2
+    return step_general(z, coef[:half], coef[half:])
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def escape_time(equation: uint8, z: complex_, coef: ndarray[complex_], max_iterations: uint16,
+                escape_number: uint8, escape_bound: float) -> int64:
+    """Returns the iteration in which z escaped, or -1 if it did not escape within max_iterations"""
+    for j in range(max_iterations):
+        z = step(equation, z, coef)
+        if has_escaped(z, escape_number, escape_bound):
+            return j
+    return -1
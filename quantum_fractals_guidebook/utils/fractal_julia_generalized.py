@@ -3,17 +3,28 @@
 # Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
 
 #############################################################
-from numpy import uint8, uint16, uint32, int32, int64, linspace, bool_, complex_, ndarray, array
-from numba import jit, prange
+from typing import Dict, List, Tuple, Union
+from numpy import uint8, uint16, uint32, int32, int64, bool_, complex_, complex128, ndarray, array
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
 
+# Import project-modules
+from .fractal_julia_calculations import has_escaped, get_escape_bound, get_grid_types
+from .fractal_julia_coefficients import get_fraction_powers_and_indices, get_fraction_coefficients
 
-@jit(nopython=True, cache=False, parallel=True, nogil=True, error_model='numpy')
+# The coefficient helpers moved to <fractal_julia_coefficients> and are re-exported for existing imports
+__all__ = ["set_general", "step_general", "set_general_horner", "get_kernel_signatures",
+           "get_fraction_powers_and_indices", "get_fraction_coefficients"]
+
+
+@jit(nopython=True, cache=True, parallel=True, nogil=True, error_model='numpy')
 def set_general(c: ndarray[complex_], z: ndarray[complex_, complex_],
                 con: ndarray[bool_, bool_], div: ndarray[uint16, uint16],
                 upper_pwrs: ndarray[uint32] = array([1]), upper_idxs: ndarray[uint32] = array([0]),
                 lower_pwrs: ndarray[uint32] = array([1]), lower_idxs: ndarray[uint32] = array([1]),
                 max_iterations: uint16 = 100, number_of_qubits: uint8 = 1, escape_number: uint8 = 2,
-                height: uint16 = 200, width: uint16 = 200,) -> ndarray[uint16, uint16]:
+                height: uint16 = 200, width: uint16 = 200,
+                stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
     """
     n-qubit mating:
         z^2^(n-1) + c[2^n-2] * z^(2^(n-1)-1) + c[2^n-4] * z^(2^(n-1)-2) + ... * c[6] * z^2 + c[4] + c[2] * z + c[0]
@@ -48,23 +59,76 @@ def set_general(c: ndarray[complex_], z: ndarray[complex_, complex_],
                     if abs(z[x, y]) > escape_number:
                         con[x, y] = False
                         div[x, y] = j
+                        if stats is not None:
+                            stats[x, j] += 1
+            if stats is not None:
+                if con[x, y]:
+                    stats[x, max_iterations] += 1
     return div
 
 
-def get_fraction_powers_and_indices(no_qubits: int64 = 1, power_offset: int64 = 0):
-    """Returns the powers and indices for any given amount of Qubits used in the <set_general> function"""
-    # Adjust the start and stop integer values for the powers
-    powers_start = 2 ** no_qubits // 2 + power_offset
-    powers_stop = 1 + power_offset
+@jit(nopython=True, cache=True, error_model='numpy')
+def step_general(z: complex_, upper_coef: ndarray[complex_], lower_coef: ndarray[complex_]) -> complex_:
+    """Evaluates numerator and denominator of the n-qubit mating with Horner's scheme"""
+    upper_val = upper_coef[0]
+    for k in range(1, upper_coef.shape[0]):
+        upper_val = upper_val * z + upper_coef[k]
+    lower_val = lower_coef[0]
+    for k in range(1, lower_coef.shape[0]):
+        lower_val = lower_val * z + lower_coef[k]
+    return upper_val / lower_val
+
+
+@jit(nopython=True, cache=True, parallel=True, nogil=True, error_model='numpy')
+def set_general_horner(upper_coef: ndarray[complex_], lower_coef: ndarray[complex_], z: ndarray[complex_, complex_],
+                       con: ndarray[bool_, bool_], div: ndarray[uint16, uint16], max_iterations: uint16 = 100,
+                       escape_number: uint8 = 2, height: uint16 = 200, width: uint16 = 200,
+                       stats: Union[ndarray, None] = None) -> ndarray[uint16, uint16]:
+    """
+    Same n-qubit mating as <set_general>, but with the coefficients from <get_fraction_coefficients>. Each
+    iteration costs two Horner evaluations of degree 2^(n-1) instead of 2^n complex powers, and pixels stop
+    iterating once they escaped. Results agree with <set_general> up to floating point rounding, which from 3
+    qubits on changes the escape time of a few pixels on the boundary of the set.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    for x in prange(width):
+        for y in range(height):
+            if con is not None:
+                if not con[x, y]:
+                    continue
+            z_val = z[x, y]
+            for j in range(max_iterations):
+                z_val = step_general(z_val, upper_coef, lower_coef)
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[x, y] = j
+                    if stats is not None:
+                        stats[x, j] += 1
+                    break
+            else:
+                if stats is not None:
+                    stats[x, max_iterations] += 1
+    return div
 
-    # Calculate all the evenly spaced specified intervals
-    upper_pwrs = linspace(start=powers_start, stop=powers_stop, num=2 ** no_qubits // 2).astype(int32)
-    upper_idxs = linspace(start=2 ** no_qubits - 2, stop=0, num=2 ** no_qubits // 2).astype(int32)
-    lower_pwrs = linspace(start=powers_start, stop=powers_stop, num=2 ** no_qubits // 2).astype(int32)
-    lower_idxs = linspace(start=2 ** no_qubits - 1,  stop=1, num=2 ** no_qubits // 2).astype(int32)
 
-    # Return
-    return upper_pwrs, upper_idxs, lower_pwrs, lower_idxs
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = (uint8, uint16, int32, int64),
+                          z_dtypes: Tuple[type, ...] = (complex128,), omit_con: bool = False) -> Dict[Dispatcher, List[tuple]]:
+    """
+    Returns the argument types of the kernels as called with the output of <get_fraction_powers_and_indices>
+    and <get_fraction_coefficients>. Only <set_general_horner> supports complex64, con=None and the read-only
+    grid of <GetJuliaArrays>.
+    """
+    signatures = {set_general: [], set_general_horner: []}
+    indices = (types.int32[::1],) * 4
+    for div_dtype in div_dtypes:
+        arrays = (types.complex128[:, ::1], types.boolean[:, ::1], from_dtype(div_dtype)[:, ::1])
+        signatures[set_general].append((types.complex128[::1],) + arrays + indices + (types.int64,) * 5 + (types.Omitted(None),))
+        for z_dtype in z_dtypes:
+            z_type = from_dtype(z_dtype)
+            for grid_type in get_grid_types(z_dtype):
+                for con_type in (types.boolean[:, ::1], types.none) if omit_con else (types.boolean[:, ::1],):
+                    arrays = (z_type[::1], z_type[::1], grid_type, con_type, from_dtype(div_dtype)[:, ::1])
+                    signatures[set_general_horner].append(arrays + (types.int64,) * 4 + (types.Omitted(None),))
+    return signatures
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import List, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import uint8, uint16, int64, complex_, ndarray
+
+# Import project-modules, none of which may import Numba
+from .fractal_julia_coefficients import EQUATIONS, get_equation_id, get_equation_coefficients
+from .fractal_profiling import Profiler, profile_stage, get_pixel_iterations
+
+
+# Complex arithmetic of Numba
+# ───────────────────────────────────────────────────────────
+# NumPy multiplies complex arrays with FMA instructions where the CPU has them, and divides by multiplying with
+# the reciprocal of the denominator. Both round differently from the kernels, and the difference grows over the
+# iterations into other escape times on the boundary of the set. In exact mode, the products and quotients are
+# computed from their real and imaginary parts with the same operations as Numba, whose division is CPython's,
+# which takes two to three times as long as the native operations of NumPy.
+def multiply_exact(a: ndarray[complex_], b: ndarray[complex_]) -> ndarray[complex_]:
+    """(a.real + a.imag i) * (b.real + b.imag i), where b may be a scalar"""
+    product = np.empty(np.broadcast(a, b).shape, dtype=np.result_type(a, b))
+    product.real = a.real * b.real - a.imag * b.imag
+    product.imag = a.real * b.imag + a.imag * b.real
+    return product
+
+
+def divide_exact(upper: ndarray[complex_], lower: ndarray[complex_]) -> ndarray[complex_]:
+    """upper / lower, scaled by the larger of the real and imaginary part of lower"""
+    by_real = np.abs(lower.real) >= np.abs(lower.imag)
+    ratio = np.where(by_real, lower.imag / lower.real, lower.real / lower.imag)
+    denom = np.where(by_real, lower.real + lower.imag * ratio, lower.real * ratio + lower.imag)
+    quotient = np.empty_like(upper)
+    quotient.real = np.where(by_real, upper.real + upper.imag * ratio, upper.real * ratio + upper.imag) / denom
+    quotient.imag = np.where(by_real, upper.imag - upper.real * ratio, upper.imag * ratio - upper.real) / denom
+    return quotient
+
+
+def step_array(equation: int, z: ndarray[complex_], coef: ndarray[complex_], exact: bool = True) -> ndarray[complex_]:
+    """Performs a single iteration of the given equation on an array, with the same operations as <step>"""
+    multiply, divide = (multiply_exact, divide_exact) if exact else (np.multiply, np.divide)
+    z2 = multiply(z, z)
+    if equation == EQUATIONS["1cn0"]:
+        return z2 + coef[0]
+    if equation == EQUATIONS["2cn1"]:
+        return divide(z2 + coef[0], z2 + coef[1])
+    if equation == EQUATIONS["2cn2"]:
+        return divide(multiply(z2, coef[0]) + 1 - coef[0], multiply(z2, coef[1]) + 1 - coef[1])
+
+    # The n-qubit mating with Horner's scheme, as in <step_general>
+    half = len(coef) // 2
+    upper_val = np.full_like(z, coef[0])
+    for k in range(1, half):
+        upper_val = multiply(upper_val, z) + coef[k]
+    lower_val = np.full_like(z, coef[half])
+    for k in range(half + 1, len(coef)):
+        lower_val = multiply(lower_val, z) + coef[k]
+    return divide(upper_val, lower_val)
+
+
+def set_active(equation: int, coef: ndarray[complex_], z: ndarray[complex_, complex_], div: ndarray[uint16, uint16],
+               max_iterations: uint16 = 100, escape_number: uint8 = 2, exact: bool = True) -> ndarray[uint16, uint16]:
+    """
+    Pure NumPy escape-time kernel, which iterates a compacted array of the points that did not escape yet, next
+    to the flat indices of those points. Escaped points are dropped after every iteration in which any escaped,
+    so the work per iteration shrinks with the number of active points instead of staying at the size of the
+    grid as in the masked <JuliaSet> of .old. When exact is set, the complex arithmetic of Numba is used, see
+    <multiply_exact> and <divide_exact>, and the values of div are the same as of the Numba kernels on
+    complex128 grids. Otherwise, and on complex64 grids, which Numba iterates partly in complex128 as the
+    integer constant of 2cn2 promotes <step>, a few pixels on the boundary of the set differ in escape time.
+    """
+    escape_bound = escape_number * escape_number * (1.0 - 1e-9)
+    result = div.reshape(-1)
+    result[:] = max_iterations - 1
+    active_z = z.reshape(-1).copy()
+    active_idx = np.arange(active_z.size, dtype=np.intp)
+
+    with np.errstate(all='ignore'):
+        for j in range(max_iterations):
+            if active_idx.size == 0:
+                break
+            active_z = step_array(equation, active_z, coef, exact)
+
+            # The same two-stage escape test as <has_escaped>, where abs() is only evaluated close to the bound
+            escaped = active_z.real * active_z.real + active_z.imag * active_z.imag > escape_bound
+            if not escaped.any():
+                continue
+            candidates = np.flatnonzero(escaped)
+            escaped[candidates] = np.abs(active_z[candidates]) > escape_number
+
+            result[active_idx[escaped]] = j
+            remaining = ~escaped
+            active_z, active_idx = active_z[remaining], active_idx[remaining]
+    return div
+
+
+def render_numpy(c_values: Union[List, ndarray], z: ndarray[complex_, complex_], equation: str = "1cn0",
+                 max_iterations: uint16 = 100, escape_number: uint8 = 2, power_offset: int64 = 0,
+                 out: Union[ndarray, None] = None, dtype: str = "uint16",
+                 profiler: Union[Profiler, None] = None, frame: Union[int, None] = None,
+                 exact: bool = True) -> ndarray:
+    """
+    Same as <render_frames> with the NumPy engine of <set_active>, for environments where Numba is not
+    available or its compile time is not worth it, e.g. a single small frame. Returns a (frames, height,
+    width) stack of escape-time maps, where c_values holds one complex number (1cn0) or one statevector
+    (2cn1, 2cn2 and general) per frame. exact selects the complex arithmetic of <set_active>.
+    """
+    equation_id = get_equation_id(equation)
+    c_values = np.asarray(c_values, dtype=complex_)
+    if c_values.ndim == 1:
+        c_values = c_values.reshape(-1, 1)
+
+    div = np.empty((len(c_values),) + z.shape, dtype=dtype) if out is None else out
+    with profile_stage(profiler, f"julia.{equation}", frame) as stats:
+        for index, c in enumerate(c_values):
+            coef = get_equation_coefficients(equation_id, c, power_offset).astype(z.dtype)
+            set_active(equation_id, coef, z, div[index], max_iterations, escape_number, exact)
+        if profiler is not None:
+            stats["pixel_iterations"] = get_pixel_iterations(div)
+    return div
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import Dict, List, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import uint8, uint16, int64, complex_, complex128, ndarray
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
+
+# Import project-modules
+from .fractal_julia_calculations import has_escaped, get_escape_bound, get_grid_types
+from .fractal_julia_equations import step
+from .fractal_julia_coefficients import get_equation_id, get_equation_coefficients
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def escape_time_periodic(equation: uint8, z: complex_, coef: ndarray[complex_], max_iterations: uint16,
+                         escape_number: uint8, escape_bound: float, tolerance: float) -> Tuple[int64, int64]:
+    """
+    Returns the iteration in which z escaped and 0, or -1 and the period of the attracting cycle the orbit of
+    z converged to, or -1 and 0 if neither happened within max_iterations. Brent's method: the orbit is compared
+    with a saved point, which is replaced by the current point after 1, 2, 4, 8, ... iterations, so a cycle
+    is found within about twice its period after the orbit converged to it within tolerance.
+    """
+    saved = z
+    tolerance_squared = tolerance * tolerance
+    power, period = 1, 0
+    for j in range(max_iterations):
+        z = step(equation, z, coef)
+        if has_escaped(z, escape_number, escape_bound):
+            return j, 0
+        period += 1
+        distance = z - saved
+        if distance.real * distance.real + distance.imag * distance.imag < tolerance_squared:
+            return -1, period
+        if period == power:
+            saved = z
+            power *= 2
+            period = 0
+    return -1, 0
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_periodic(equation: uint8, coef: ndarray[complex_], z: ndarray[complex_, complex_],
+                 div: ndarray[uint16, uint16], period: ndarray[uint16, uint16], max_iterations: uint16 = 100,
+                 escape_number: uint8 = 2, tolerance: float = 1e-10) -> ndarray[uint16, uint16]:
+    """
+    Same as <set_frames> for a single frame, but pixels whose orbit runs into an attracting cycle stop iterating
+    as soon as the cycle is found. They are set to max_iterations - 1 in div like every pixel that did not
+    escape, and the period of the cycle is written to period, which is 0 for every other pixel.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    height, width = z.shape
+    for row in prange(height):
+        for col in range(width):
+            j, cycle = escape_time_periodic(equation, z[row, col], coef, max_iterations, escape_number, escape_bound,
+                                            tolerance)
+            div[row, col] = j if j >= 0 else max_iterations - 1
+            period[row, col] = cycle
+    return div
+
+
+def render_periodic(z: ndarray[complex_, complex_], c: Union[complex, ndarray], equation: str = "2cn1",
+                    max_iterations: uint16 = 100, escape_number: uint8 = 2, power_offset: int64 = 0,
+                    tolerance: float = 1e-10, dtype: str = "uint16") -> Tuple[ndarray, ndarray]:
+    """
+    Returns the escape-time map of the grid z together with the map of cycle periods of <set_periodic>, which
+    is mostly worth it for the matings (2cn1, 2cn2 and general), whose interior converges to attracting
+    cycles and would otherwise burn the full iteration budget. A pixel that converges slower than
+    tolerance per iteration, or escapes after first coming within tolerance of a cycle, keeps the value
+    of the brute-force render, so the escape-time map only differs when tolerance is set too loose.
+    """
+    equation_id = get_equation_id(equation)
+    coef = get_equation_coefficients(equation_id, c, power_offset).astype(z.dtype)
+    div = np.empty(z.shape, dtype=dtype)
+    period = np.empty(z.shape, dtype=np.uint16)
+    set_periodic(equation_id, coef, z, div, period, max_iterations, escape_number, tolerance)
+    return div, period
+
+
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = (uint8, uint16),
+                          z_dtypes: Tuple[type, ...] = (complex128,)) -> Dict[Dispatcher, List[tuple]]:
+    """
+    Returns the argument types of <set_periodic> as called by <render_periodic> with the read-only grid of <GetJuliaArrays>
+    """
+    signatures = {set_periodic: []}
+    for z_dtype in z_dtypes:
+        for div_dtype in div_dtypes:
+            arrays = (from_dtype(z_dtype)[::1], get_grid_types(z_dtype)[1], from_dtype(div_dtype)[:, ::1],
+                      types.uint16[:, ::1])
+            signatures[set_periodic].append((types.int64,) + arrays + (types.int64, types.int64, types.float64))
+    return signatures
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from typing import Dict, Iterator, List, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import uint8, uint16, int64, complex_, complex128, ndarray
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
+
+# Import project-modules
+from .fractal_julia_calculations import get_escape_bound, get_grid_types
+from .fractal_julia_equations import escape_time
+from .fractal_julia_coefficients import get_equation_id, get_equation_coefficients
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_progressive(equation: uint8, coef: ndarray[complex_], z: ndarray[complex_, complex_],
+                    div: ndarray[uint16, uint16], scale: int64, refine: bool, max_iterations: uint16 = 100,
+                    escape_number: uint8 = 2) -> ndarray[uint16, uint16]:
+    """
+    Computes the pixels of div on the grid with a spacing of scale pixels, skipping the pixels already computed
+    by the previous pass with a spacing of 2 * scale when refine is set, and fills the scale x scale block to the lower right of
+    each computed pixel with its value. Blocks only cover pixels that are computed by finer passes, so after
+    the pass with scale 1 every pixel holds the same value as a full resolution render.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    height, width = z.shape
+    rows = (height + scale - 1) // scale
+    for index in prange(rows):
+        row = index * scale
+        for col in range(0, width, scale):
+            if refine and row % (2 * scale) == 0 and col % (2 * scale) == 0:
+                value = div[row, col]
+            else:
+                j = escape_time(equation, z[row, col], coef, max_iterations, escape_number, escape_bound)
+                value = j if j >= 0 else max_iterations - 1
+            if scale == 1:
+                div[row, col] = value
+                continue
+            for block_row in range(row, min(row + scale, height)):
+                for block_col in range(col, min(col + scale, width)):
+                    div[block_row, block_col] = value
+    return div
+
+
+def get_scales(start_scale: int = 8) -> List[int]:
+    """Returns the pixel spacing of every pass, halving from start_scale (a power of two) down to 1"""
+    if start_scale < 1 or start_scale & (start_scale - 1):
+        raise ValueError(f"start_scale must be a power of two, got {start_scale}")
+    return [start_scale >> shift for shift in range(start_scale.bit_length())]
+
+
+def render_progressive(z: ndarray[complex_, complex_], c: Union[complex, ndarray], equation: str = "1cn0",
+                       max_iterations: uint16 = 100, escape_number: uint8 = 2, power_offset: int64 = 0,
+                       start_scale: int = 8, out: Union[ndarray, None] = None,
+                       dtype: str = "uint16") -> Iterator[Tuple[int, ndarray]]:
+    """
+    Renders the escape-time map of the grid z in passes of increasing resolution, starting with every
+    start_scale-th pixel in both directions, and yields (scale, div) after each pass. The intermediate div
+    is block-filled, so it can be shown as is, and every pass only computes the pixels that are new at its
+    resolution, e.g. the first of four passes at 1/8 resolution computes 1/64 of the pixels. The last div is
+    identical to a full resolution render with <render_frames>. div is the same buffer in every pass and is
+    overwritten by the next pass, so it must be copied if it is kept.
+    """
+    equation_id = get_equation_id(equation)
+    coef = get_equation_coefficients(equation_id, c, power_offset).astype(z.dtype)
+    div = np.empty(z.shape, dtype=dtype) if out is None else out
+    for index, scale in enumerate(get_scales(start_scale)):
+        set_progressive(equation_id, coef, z, div, scale, index > 0, max_iterations, escape_number)
+        yield scale, div
+
+
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = (uint8, uint16),
+                          z_dtypes: Tuple[type, ...] = (complex128,)) -> Dict[Dispatcher, List[tuple]]:
+    """
+    Returns the argument types of <set_progressive> as called by <render_progressive> with the read-only grid of <GetJuliaArrays>
+    """
+    signatures = {set_progressive: []}
+    for z_dtype in z_dtypes:
+        for div_dtype in div_dtypes:
+            arrays = (from_dtype(z_dtype)[::1], get_grid_types(z_dtype)[1], from_dtype(div_dtype)[:, ::1])
+            signatures[set_progressive].append((types.int64,) + arrays + (types.int64, types.boolean, types.int64,
+                                                                           types.int64))
+    return signatures
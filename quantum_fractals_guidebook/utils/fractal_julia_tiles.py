@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import uint8, uint16, int64, complex_, ndarray
+from numba import jit, prange, types, from_dtype
+from numba.core.dispatcher import Dispatcher
+
+# Import project-modules
+from .fractal_julia_arrays import GetJuliaArrays
+from .fractal_julia_calculations import get_escape_bound
+from .fractal_julia_equations import escape_time
+from .fractal_julia_coefficients import get_equation_id, get_equation_coefficients
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def get_coordinate(index: int64, start: float, stop: float, step: float, num: int64) -> float:
+    """The same value as np.linspace(start, stop, num)[index], where step = (stop - start) / (num - 1)"""
+    if index == num - 1:
+        return stop
+    return index * step + start
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_tiles(equation: uint8, coef: ndarray[complex_], bounds: ndarray, origins: ndarray[int64, int64],
+              height: int64, width: int64, div: ndarray, max_iterations: uint16 = 100,
+              escape_number: uint8 = 2) -> ndarray:
+    """
+    Renders a group of tiles of a height x width image into div with the shape (tiles, tile height, tile width),
+    where origins holds the (row, column) of the upper left pixel of each tile and bounds the x_min, x_max,
+    y_min and y_max of the image. The coordinates are generated on the fly with the same values as the grid
+    of <GetJuliaArrays.get_z_array>, so no complex array is ever allocated.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    x_step = (bounds[1] - bounds[0]) / (width - 1) if width > 1 else 0.0
+    y_step = (bounds[3] - bounds[2]) / (height - 1) if height > 1 else 0.0
+    tiles, tile_height, tile_width = div.shape
+    for index in prange(tiles * tile_height):
+        tile, tile_row = index // tile_height, index % tile_height
+        row = origins[tile, 0] + tile_row
+        if row >= height:
+            continue
+        y_val = get_coordinate(row, bounds[2], bounds[3], y_step, height)
+        for tile_col in range(tile_width):
+            col = origins[tile, 1] + tile_col
+            if col >= width:
+                break
+            z_val = complex(get_coordinate(col, bounds[0], bounds[1], x_step, width), y_val)
+            j = escape_time(equation, z_val, coef, max_iterations, escape_number, escape_bound)
+            div[tile, tile_row, tile_col] = j if j >= 0 else max_iterations - 1
+    return div
+
+
+def render_tiled(julia_arrays: GetJuliaArrays, c: Union[complex, ndarray], path: Union[str, Path],
+                 equation: str = "1cn0", tile_size: int = 1024, tiles_per_launch: int = 4, escape_number: uint8 = 2,
+                 power_offset: int64 = 0) -> np.memmap:
+    """
+    Renders the image described by <julia_arrays> (bounds, resolution, iterations and div_dtype) tile by tile
+    into a memory-mapped .npy file at path and returns the memory map. Each launch renders tiles_per_launch
+    tiles in parallel, which are then written to the file, so the peak memory is bounded by the tile size and
+    not by the image size, e.g. a 40k x 40k poster with the default settings needs 8 MB of uint16 buffers.
+    The escape-time values are identical to running the kernels on the full grid, which is always complex128.
+    """
+    height, width = julia_arrays.shape
+    output = np.lib.format.open_memmap(str(path), mode="w+", dtype=julia_arrays.div_dtype, shape=(height, width))
+
+    # All tiles in row-major order, of which the tiles at the bottom and right edges may be partially filled
+    origins = np.array([(row, col) for row in range(0, height, tile_size) for col in range(0, width, tile_size)],
+                       dtype=np.int64).reshape(-1, 2)
+    bounds = np.array(julia_arrays.get_bounds(), dtype=np.float64)
+    coef = get_equation_coefficients(equation, c, power_offset)
+    buffer = np.empty((tiles_per_launch, tile_size, tile_size), dtype=julia_arrays.div_dtype)
+
+    for group_start in range(0, len(origins), tiles_per_launch):
+        group = np.ascontiguousarray(origins[group_start:group_start + tiles_per_launch])
+        set_tiles(get_equation_id(equation), coef, bounds, group, height, width, buffer[:len(group)],
+                  julia_arrays.julia_iterations, escape_number)
+
+        for tile, (row, col) in enumerate(group):
+            rows, cols = min(tile_size, height - row), min(tile_size, width - col)
+            output[row:row + rows, col:col + cols] = buffer[tile, :rows, :cols]
+        output.flush()
+    return output
+
+
+def get_kernel_signatures(div_dtypes: Tuple[type, ...] = (uint8, uint16)) -> Dict[Dispatcher, List[tuple]]:
+    """Returns the argument types of <set_tiles> as called by <render_tiled>"""
+    signatures = {set_tiles: []}
+    for div_dtype in div_dtypes:
+        arrays = (types.complex128[::1], types.float64[::1], types.int64[:, ::1])
+        signatures[set_tiles].append((types.int64,) + arrays + (types.int64, types.int64,
+                                     from_dtype(div_dtype)[:, :, ::1], types.int64, types.int64))
+    return signatures
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from time import perf_counter
+from typing import Dict, Tuple
+
+# Import externally installed libraries
+from numpy import uint8, uint16, int32, int64, complex128
+
+# Import project-modules
+from . import fractal_julia_calculations, fractal_julia_generalized, fractal_julia_batch, fractal_julia_tiles, \
+    fractal_julia_zoom, fractal_julia_progressive, fractal_julia_periodicity
+
+
+# ───────────────────────────────────────────────────────────
+def warmup(div_dtypes: Tuple[type, ...] = (uint8, uint16, int32, int64), z_dtypes: Tuple[type, ...] = (complex128,),
+           omit_con: bool = False, verbose: bool = False) -> Dict[str, float]:
+    """
+    Compiles every Julia kernel variant ahead of time, e.g. when a service or worker boots, so that the first
+    rendered frame does not pay the compile cost of the parallel kernels. Pass z_dtypes=(complex128, complex64)
+    and/or omit_con=True to also compile the compact precision modes of <GetJuliaArrays>.
+
+    All kernels are declared with cache=True, so the machine code is stored next to the modules in __pycache__
+    (or in the directory given by the NUMBA_CACHE_DIR environment variable). Only the first warmup on a machine
+    compiles, later processes load the cached kernels from disk. Returns the seconds spent per kernel.
+    """
+    timings = {}
+    kernel_signatures = {**fractal_julia_calculations.get_kernel_signatures(div_dtypes, z_dtypes, omit_con),
+                         **fractal_julia_generalized.get_kernel_signatures(div_dtypes, z_dtypes, omit_con),
+                         **fractal_julia_batch.get_kernel_signatures(div_dtypes, z_dtypes),
+                         **fractal_julia_tiles.get_kernel_signatures(div_dtypes),
+                         **fractal_julia_zoom.get_kernel_signatures(),
+                         **fractal_julia_progressive.get_kernel_signatures(div_dtypes, z_dtypes),
+                         **fractal_julia_periodicity.get_kernel_signatures(div_dtypes, z_dtypes)}
+    for kernel, signatures in kernel_signatures.items():
+        start = perf_counter()
+        for signature in signatures:
+            kernel.compile(signature)
+        timings[kernel.__name__] = perf_counter() - start
+        if verbose:
+            print(f"{kernel.__name__:<18} {len(signatures):>3} signatures in {timings[kernel.__name__]:.2f}s")
+    return timings
+
+
+if __name__ == "__main__":
+    warmup(verbose=True)
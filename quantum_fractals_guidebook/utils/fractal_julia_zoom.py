@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from decimal import Decimal, localcontext
+from math import log10
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+# Import externally installed libraries
+import numpy as np
+from numpy import uint8, uint16, int64, complex_, ndarray
+from numba import jit, prange, types
+from numba.core.dispatcher import Dispatcher
+
+# Import project-modules
+from .fractal_julia_arrays import GetJuliaArrays
+from .fractal_julia_batch import render_frame
+from .fractal_julia_calculations import has_escaped, get_escape_bound
+from .fractal_julia_coefficients import EQUATIONS, get_equation_id, get_equation_coefficients
+
+# A center given as a complex number, or as two strings/Decimals for coordinates beyond float64 precision
+Center = Union[complex, Tuple[Union[str, Decimal], Union[str, Decimal]]]
+DecimalComplex = Tuple[Decimal, Decimal]
+
+
+# Equations as rational functions N(z) / D(z), evaluated with Horner's scheme
+# ───────────────────────────────────────────────────────────
+def get_rational_coefficients(equation: str, c: Union[complex, ndarray], power_offset: int64 = 0) -> Tuple[ndarray, ndarray]:
+    """Returns the coefficients (highest power first) of the numerator and denominator of an equation"""
+    equation_id = get_equation_id(equation)
+    coef = get_equation_coefficients(equation_id, c, power_offset)
+    if equation_id == EQUATIONS["1cn0"]:
+        return np.array([1, 0, coef[0]], dtype=complex_), np.array([1], dtype=complex_)
+    if equation_id == EQUATIONS["2cn1"]:
+        return np.array([1, 0, coef[0]], dtype=complex_), np.array([1, 0, coef[1]], dtype=complex_)
+    if equation_id == EQUATIONS["2cn2"]:
+        return (np.array([coef[0], 0, 1 - coef[0]], dtype=complex_),
+                np.array([coef[1], 0, 1 - coef[1]], dtype=complex_))
+    half = len(coef) // 2
+    return coef[:half].copy(), coef[half:].copy()
+
+
+def _decimal_horner(coef: Sequence[DecimalComplex], z: DecimalComplex) -> DecimalComplex:
+    re, im = coef[0]
+    for coef_re, coef_im in coef[1:]:
+        re, im = re * z[0] - im * z[1] + coef_re, re * z[1] + im * z[0] + coef_im
+    return re, im
+
+
+def get_reference_orbit(upper_coef: ndarray, lower_coef: ndarray, center: DecimalComplex, max_iterations: int,
+                        escape_number: int, precision: int) -> ndarray:
+    """
+    Iterates the center of the frame with <precision> significant digits and returns its orbit rounded to
+    complex128, up to and including the first point that escaped or max_iterations + 1 points.
+    """
+    with localcontext() as context:
+        context.prec = precision
+        upper = [(Decimal(value.real), Decimal(value.imag)) for value in upper_coef]
+        lower = [(Decimal(value.real), Decimal(value.imag)) for value in lower_coef]
+        escape_squared = Decimal(escape_number) ** 2
+
+        z = (+center[0], +center[1])
+        orbit = [complex(float(z[0]), float(z[1]))]
+        for _ in range(max_iterations):
+            (upper_re, upper_im), (lower_re, lower_im) = _decimal_horner(upper, z), _decimal_horner(lower, z)
+            denominator = lower_re * lower_re + lower_im * lower_im
+            if denominator == 0:
+                break
+            z = ((upper_re * lower_re + upper_im * lower_im) / denominator,
+                 (upper_im * lower_re - upper_re * lower_im) / denominator)
+            orbit.append(complex(float(z[0]), float(z[1])))
+            if z[0] * z[0] + z[1] * z[1] > escape_squared:
+                break
+    return np.array(orbit, dtype=complex_)
+
+
+@jit(nopython=True, cache=True, error_model='numpy')
+def horner_difference(coef: ndarray[complex_], z_ref: complex_, delta: complex_) -> Tuple[complex_, complex_]:
+    """Returns P(z_ref) and P(z_ref + delta) - P(z_ref) without cancellation for small delta"""
+    value, difference = coef[0], 0j
+    for k in range(1, coef.shape[0]):
+        difference = difference * (z_ref + delta) + value * delta
+        value = value * z_ref + coef[k]
+    return value, difference
+
+
+@jit(nopython=True, cache=True, parallel=True, error_model='numpy')
+def set_perturbation(upper_coef: ndarray[complex_], lower_coef: ndarray[complex_], orbit: ndarray[complex_],
+                     x_step: float, y_step: float, div: ndarray, max_iterations: uint16 = 100,
+                     escape_number: uint8 = 2) -> ndarray:
+    """
+    Escape-time map around the reference orbit of the frame center, where each pixel only iterates its offset
+    delta from the reference point in float64: with N and D the numerator and denominator,
+        delta' = (ΔN * D - N * ΔD) / (D * (D + ΔD))
+    The pixel is rebased onto the start of the reference orbit when the reference orbit ends (escaped) or when
+    the pixel is closer to the reference start than to the current reference point, which avoids glitches.
+    The orbit must hold at least two points, see <render_zoom_path>.
+    """
+    escape_bound = get_escape_bound(escape_number)
+    height, width = div.shape
+    orbit_length = orbit.shape[0]
+    for row in prange(height):
+        for col in range(width):
+            delta = complex((col - (width - 1) / 2) * x_step, (row - (height - 1) / 2) * y_step)
+            div[row, col] = max_iterations - 1
+            m = 0
+            for j in range(max_iterations):
+                # The reference orbit ended (escaped), so continue from its start before indexing past its end
+                if m == orbit_length - 1:
+                    delta, m = orbit[m] + delta - orbit[0], 0
+                z_ref = orbit[m]
+                upper_val, upper_diff = horner_difference(upper_coef, z_ref, delta)
+                lower_val, lower_diff = horner_difference(lower_coef, z_ref, delta)
+                delta = (upper_diff * lower_val - upper_val * lower_diff) / (lower_val * (lower_val + lower_diff))
+                m += 1
+
+                z_val = orbit[m] + delta
+                if has_escaped(z_val, escape_number, escape_bound):
+                    div[row, col] = j
+                    break
+
+                offset = z_val - orbit[0]
+                if (offset.real * offset.real + offset.imag * offset.imag <
+                        delta.real * delta.real + delta.imag * delta.imag):
+                    delta, m = offset, 0
+    return div
+
+
+# Zoom paths
+# ───────────────────────────────────────────────────────────
+def to_decimal_center(center: Center) -> DecimalComplex:
+    if isinstance(center, (complex, float, int)):
+        return Decimal(complex(center).real), Decimal(complex(center).imag)
+    return Decimal(center[0]), Decimal(center[1])
+
+
+def get_zoom_path(keyframes: Sequence[Tuple[Center, float]], number_of_frames: int) -> List[Tuple[DecimalComplex, float]]:
+    """
+    Interpolates the (center, zoom) keyframes, which are spread evenly over the frames, into one (center, zoom)
+    per frame. The zoom is interpolated exponentially for a constant zoom speed and the center linearly in
+    Decimal arithmetic, so deep centers keep all their digits.
+    """
+    path = []
+    centers = [to_decimal_center(center) for center, _ in keyframes]
+    zooms = [float(zoom) for _, zoom in keyframes]
+    segments = max(1, len(keyframes) - 1)
+    for frame in range(number_of_frames):
+        position = frame * segments / max(1, number_of_frames - 1)
+        index = min(int(position), len(keyframes) - 2) if len(keyframes) > 1 else 0
+        t = position - index if len(keyframes) > 1 else 0.0
+        next_index = min(index + 1, len(keyframes) - 1)
+
+        zoom = zooms[index] * (zooms[next_index] / zooms[index]) ** t
+        fraction = Decimal(t)
+        center = tuple(start + (end - start) * fraction for start, end in zip(centers[index], centers[next_index]))
+        path.append((center, zoom))
+    return path
+
+
+def get_adaptive_iterations(zoom: float, base_iterations: int = 100, iterations_per_decade: int = 50,
+                            max_iterations: int = 65535) -> int:
+    """More iterations for deeper zoom levels, as the detail near the boundary needs longer orbits to resolve"""
+    return int(min(max_iterations, base_iterations + iterations_per_decade * max(0.0, log10(max(zoom, 1.0)))))
+
+
+def render_zoom_path(keyframes: Sequence[Tuple[Center, float]], c: Union[complex, ndarray], number_of_frames: int,
+                     equation: str = "1cn0", height: int = 200, width: int = 200, x_width: float = 1.5,
+                     y_width: float = 1.5, base_iterations: int = 100, iterations_per_decade: int = 50,
+                     escape_number: int = 2, perturbation_zoom: float = 1e10,
+                     power_offset: int64 = 0) -> Iterator[ndarray]:
+    """
+    Yields one (height, width) uint16 escape-time map per frame along a zoom path through the (center, zoom)
+    keyframes, where a frame shows center ± x_width / zoom like <GetJuliaArrays>. Frames below perturbation_zoom
+    are rendered directly on a float64 grid. Deeper frames iterate a high-precision reference orbit of the
+    center and only track the float64 offset of each pixel from it, which keeps working far beyond the
+    ~1e13 zoom where a float64 grid runs out of precision. A deep frame whose center is a pole of the equation
+    has no reference orbit to follow and is rendered directly as well.
+    """
+    upper_coef, lower_coef = get_rational_coefficients(equation, c, power_offset)
+    for center, zoom in get_zoom_path(keyframes, number_of_frames):
+        max_iterations = get_adaptive_iterations(zoom, base_iterations, iterations_per_decade)
+        orbit = None
+        if zoom >= perturbation_zoom:
+            # Enough digits to resolve a pixel at this zoom level plus a margin for the rounding in the orbit
+            precision = int(log10(zoom)) + 30
+            orbit = get_reference_orbit(upper_coef, lower_coef, center, max_iterations, escape_number, precision)
+
+        if orbit is None or len(orbit) < 2:
+            julia_arrays = GetJuliaArrays(max_iterations, float(center[0]), x_width, float(center[1]), y_width,
+                                          height, width, zoom)
+            yield render_frame(c, julia_arrays.get_z_array(), equation, max_iterations, escape_number, power_offset)
+            continue
+
+        x_step = 2 * x_width / zoom / max(1, width - 1)
+        y_step = 2 * y_width / zoom / max(1, height - 1)
+        div = np.empty((height, width), dtype=uint16)
+        yield set_perturbation(upper_coef, lower_coef, orbit, x_step, y_step, div, max_iterations, escape_number)
+
+
+def get_kernel_signatures() -> Dict[Dispatcher, List[tuple]]:
+    """Returns the argument types of <set_perturbation> as called by <render_zoom_path>"""
+    arrays = (types.complex128[::1],) * 3
+    return {set_perturbation: [arrays + (types.float64, types.float64, types.uint16[:, ::1], types.int64, types.int64)]}
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, Iterator, List, NamedTuple, Union
+import json
+import os
+import sys
+import threading
+import tracemalloc
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+
+
+class StageRecord(NamedTuple):
+    name: str                   # Stage such as 'circuit', 'julia.2cn1', 'bloch' or 'gif'
+    frame: Union[int, None]
+    start_ns: int               # perf_counter_ns, which is shared between processes on Linux and macOS
+    duration_ns: int
+    peak_bytes: int             # Peak of the memory traced by tracemalloc over the stage, above its start
+    allocated_blocks: int       # Memory blocks allocated by Python over the stage and still alive at its end
+    pixel_iterations: int       # Iterations summed over all pixels, for Julia stages
+    pid: int
+    tid: int
+
+
+def get_pixel_iterations(div: ndarray) -> int:
+    """
+    Iterations summed over all pixels of escape-time maps of any shape: a pixel that escaped in iteration j
+    took j + 1 iterations, and a pixel that did not escape is set to max_iterations - 1 and took max_iterations.
+    """
+    return int(div.sum(dtype=np.int64)) + div.size
+
+
+class Profiler:
+    def __init__(self, track_allocations: bool = True) -> None:
+        """
+        Opt-in instrumentation of the render pipeline, which is passed as profiler to <FractalQuantumCircuit>,
+        <QuantumFractalVisualization>, <render_frames>, <render_numpy> and <render_animation>. Every stage
+        records its wall time, the peak memory it allocated and, for the Julia kernels, the number of
+        pixel-iterations. The records are aggregated by <get_report> or exported by <save_chrome_trace> for
+        chrome://tracing or Perfetto.
+
+        The peak memory is traced by tracemalloc, which sees the NumPy buffers next to the Python objects, but not
+        the arrays allocated inside the Numba kernels. tracemalloc slows down allocation-heavy Python code, such as
+        the Qiskit and matplotlib stages, which makes track_allocations=False the choice for timings only. The
+        allocated blocks are counted by sys.getallocatedblocks, i.e. the Python objects and small buffers a stage
+        leaves behind. Both are process-wide, so stages running at the same time in other threads add to them.
+
+        A profiler that started tracemalloc stops it again on <close>, or at the end of a with block.
+        """
+        self.track_allocations = track_allocations
+        self.records: List[StageRecord] = []
+        self._lock = threading.Lock()
+        self._open_peaks: List[List[int]] = []   # [start, peak] of the stages in progress, outermost first
+        self._started_tracemalloc = track_allocations and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    def close(self) -> None:
+        """Stops the allocation tracking, while the records stay available for the reports"""
+        self.track_allocations = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def stage(self, name: str, frame: Union[int, None] = None) -> Iterator[Dict[str, int]]:
+        """
+        Records the enclosed block as a stage. The yielded dict takes the pixel-iterations of the stage, e.g.
+        stats["pixel_iterations"] = get_pixel_iterations(div).
+        """
+        stats = {"pixel_iterations": 0}
+        track_allocations = self.track_allocations
+        peak = self._enter_peak() if track_allocations else None
+        blocks = sys.getallocatedblocks() if track_allocations else 0
+        start = perf_counter_ns()
+        try:
+            yield stats
+        finally:
+            duration = perf_counter_ns() - start
+            allocated_blocks = max(0, sys.getallocatedblocks() - blocks) if track_allocations else 0
+            peak_bytes = self._exit_peak(peak) if track_allocations else 0
+            self.add(StageRecord(name, frame, start, duration, peak_bytes, allocated_blocks, stats["pixel_iterations"],
+                                 os.getpid(), threading.get_ident()))
+
+    def _fold_peak(self) -> None:
+        # tracemalloc keeps a single peak, which is carried into the stages in progress before it is reset
+        _, peak = tracemalloc.get_traced_memory()
+        for open_peak in self._open_peaks:
+            open_peak[1] = max(open_peak[1], peak)
+
+    def _enter_peak(self) -> List[int]:
+        with self._lock:
+            self._fold_peak()
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            peak = [current, current]
+            self._open_peaks.append(peak)
+            return peak
+
+    def _exit_peak(self, peak: List[int]) -> int:
+        with self._lock:
+            self._fold_peak()
+            self._open_peaks.remove(peak)
+            return peak[1] - peak[0]
+
+    def add(self, record: StageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def extend(self, records: List[StageRecord]) -> None:
+        """Adds the records of another profiler, e.g. of a worker process of <render_animation>"""
+        with self._lock:
+            self.records.extend(records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def get_report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates the records per stage, in the order in which the stages first occurred, where peak_bytes is the
+        largest peak of a single call and allocated_blocks the sum over all calls
+        """
+        report = {}
+        for record in self.records:
+            stage = report.setdefault(record.name, {"calls": 0, "frames": set(), "total_s": 0.0, "max_s": 0.0,
+                                                    "peak_bytes": 0, "allocated_blocks": 0, "pixel_iterations": 0})
+            seconds = record.duration_ns / 1e9
+            stage["calls"] += 1
+            stage["total_s"] += seconds
+            stage["max_s"] = max(stage["max_s"], seconds)
+            stage["peak_bytes"] = max(stage["peak_bytes"], record.peak_bytes)
+            stage["allocated_blocks"] += record.allocated_blocks
+            stage["pixel_iterations"] += record.pixel_iterations
+            if record.frame is not None:
+                stage["frames"].add(record.frame)
+
+        for stage in report.values():
+            stage["frames"] = len(stage["frames"])
+            stage["mean_s"] = stage["total_s"] / stage["calls"]
+            stage["pixel_iterations_per_s"] = stage["pixel_iterations"] / stage["total_s"] if stage["total_s"] else 0.0
+        return report
+
+    def format_report(self) -> str:
+        """The report of <get_report> as a table, with the share of each stage in the total time of all stages"""
+        report = self.get_report()
+        total = sum(stage["total_s"] for stage in report.values()) or 1.0
+        lines = [f"{'stage':<16} {'calls':>6} {'total s':>9} {'share':>6} {'mean ms':>9} {'max ms':>9} "
+                 f"{'peak MB':>9} {'blocks':>9} {'Mpx-it/s':>9}"]
+        for name, stage in report.items():
+            lines.append(f"{name:<16} {stage['calls']:>6} {stage['total_s']:>9.3f} {stage['total_s'] / total:>6.1%} "
+                         f"{stage['mean_s'] * 1e3:>9.2f} {stage['max_s'] * 1e3:>9.2f} "
+                         f"{stage['peak_bytes'] / 1e6:>9.1f} {stage['allocated_blocks']:>9} "
+                         f"{stage['pixel_iterations_per_s'] / 1e6:>9.1f}")
+        return "\n".join(lines)
+
+    def get_chrome_trace(self) -> Dict:
+        """The records in the Trace Event Format, as complete events with microsecond timestamps"""
+        events = []
+        for record in self.records:
+            args = {"peak_bytes": record.peak_bytes, "allocated_blocks": record.allocated_blocks}
+            if record.frame is not None:
+                args["frame"] = record.frame
+            if record.pixel_iterations:
+                args["pixel_iterations"] = record.pixel_iterations
+            events.append({"name": record.name, "cat": record.name.split(".")[0], "ph": "X",
+                           "ts": record.start_ns / 1e3, "dur": record.duration_ns / 1e3, "pid": record.pid,
+                           "tid": record.tid, "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.get_chrome_trace()))
+        return path
+
+
+def profile_stage(profiler: Union[Profiler, None], name: str, frame: Union[int, None] = None):
+    """Returns the stage context manager of profiler, or a no-op one when profiling is off"""
+    if profiler is None:
+        return nullcontext({"pixel_iterations": 0})
+    return profiler.stage(name, frame)
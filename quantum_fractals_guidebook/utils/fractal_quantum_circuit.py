@@ -4,16 +4,22 @@
 
 # ───────────────────────────────────────────────────────────
 # Importing standard python libraries
-from typing import Tuple, Literal, Union
+from typing import TYPE_CHECKING, List, Tuple, Literal, Union
 from enum import Enum, EnumMeta
 from math import pi
 
-# Importing standard Qiskit libraries
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
+# Import externally installed libraries
 from numpy import array, ndarray
 import numpy as np
 
+# Import project-modules
+from .fractal_profiling import Profiler, profile_stage
+from .fractal_statevector_cache import StatevectorCache
+
+# Qiskit is imported when the first circuit is simulated
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
 # Enum dataclasses
 # ───────────────────────────────────────────────────────────
 class CaseInsensitiveEnumMeta(EnumMeta):
@@ -32,22 +38,41 @@ class Rotate(Enum, metaclass=CaseInsensitiveEnumMeta):
 # Method
 # ───────────────────────────────────────────────────────────
 class FractalQuantumCircuit:
-    def __init__(self, number_of_qubits: int = 1, quantum_circuit: Union[QuantumCircuit, None] = None,
-                 total_number_of_frames: int = 60) -> None:
+    def __init__(self, number_of_qubits: int = 1, quantum_circuit: Union["QuantumCircuit", None] = None,
+                 total_number_of_frames: int = 60, statevector_cache: Union[StatevectorCache, None] = None,
+                 profiler: Union[Profiler, None] = None) -> None:
         # Define the number of qubits and frames for the fractal
         self.n_qubits = number_of_qubits
         self.n_frames = total_number_of_frames
 
+        # Optional cache of the simulated statevectors, which may be shared between instances
+        self.statevector_cache = statevector_cache
+
+        # Optional instrumentation recording the simulation of each frame as the stage 'circuit'
+        self.profiler = profiler
+
         if quantum_circuit is None:
+            from qiskit import QuantumCircuit
+
             # Create the circuit for which the gates will be applied
             self.quantum_circuit = QuantumCircuit(number_of_qubits)
             self.quantum_circuit.h(0)
         else:
             self.quantum_circuit = quantum_circuit
 
+    def get_rotation_indices(self, rotate: str = "first") -> List[int]:
+        """Returns the qubits to rotate depending on the rotation mode"""
+        if rotate == Rotate.FIRST.value:
+            return [0]
+        elif rotate == Rotate.LAST.value:
+            return [self.n_qubits - 1]
+        elif rotate == Rotate.ALL.value:
+            return list(range(0, self.n_qubits))
+        return [0]
+
     # noinspection PyUnresolvedReferences
     def get_quantum_circuit(self, rotate: Literal[Rotate.FIRST, Rotate.LAST, Rotate.ALL] = "first",
-                            frame_iteration: int = 0) -> Tuple[np.complex128, QuantumCircuit, ndarray[np.complex128]]:
+                            frame_iteration: int = 0) -> Tuple[np.complex128, "QuantumCircuit", ndarray[np.complex128]]:
         # In case quantum_circuit is already defined, delete the variable before assigning
         # it again to prevent multiple copies of the class variable being saved in memory
         if "quantum_circuit" in globals():
@@ -57,23 +82,23 @@ class FractalQuantumCircuit:
             # Create a fresh copy of the Quantum Circuit
             quantum_circuit = self.quantum_circuit.copy()
 
-        # Apply the rotation to the Quantum Circuit depending on which qubit to rotate
-        if rotate == Rotate.FIRST.value:
-            rotation_indices = [0]
-        elif rotate == Rotate.LAST.value:
-            rotation_indices = [self.n_qubit - 1]
-        elif rotate == Rotate.ALL.value:
-            rotation_indices = list(range(0, self.n_qubit))
-        else:
-            rotation_indices = [0]
-
         # Calculate the rotation Phi and apply it to the local Quantum Circuit
         phi_rotation = frame_iteration * 2 * pi / self.n_frames
-        for rotation_index in rotation_indices:
+        for rotation_index in self.get_rotation_indices(rotate):
             quantum_circuit.rz(phi_rotation, rotation_index)
 
+        # Look up the statevectors of this frame in case the same circuit was simulated before
+        if self.statevector_cache is not None:
+            cache_key = self.statevector_cache.get_key(self.quantum_circuit, self.get_rotation_indices(rotate),
+                                                       frame_iteration, self.n_frames)
+            cached = self.statevector_cache.get(cache_key)
+            if cached is not None:
+                return cached[0], quantum_circuit, cached[1].copy()
+
         # Simulate the Quantum Circuit and extract the statevector
-        statevector_array = Statevector(quantum_circuit)
+        from qiskit.quantum_info import Statevector
+        with profile_stage(self.profiler, "circuit", frame_iteration):
+            statevector_array = Statevector(quantum_circuit)
         statevector_idx_n = statevector_array.data
         statevector_idx_0 = statevector_array.data[0]
         statevector_idx_1 = statevector_array.data[1]
@@ -85,4 +110,36 @@ class FractalQuantumCircuit:
         else:
             statevector_new = 0
 
+        if self.statevector_cache is not None:
+            self.statevector_cache.put(cache_key, (statevector_new, array(statevector_idx_n)))
         return statevector_new, quantum_circuit, array(statevector_idx_n)
+
+    # noinspection PyUnresolvedReferences
+    def get_statevectors(self, rotate: Literal[Rotate.FIRST, Rotate.LAST, Rotate.ALL] = "first"
+                         ) -> Tuple[ndarray[np.complex128], ndarray[np.complex128]]:
+        """
+        Returns the statevector_new values (frames,) and statevectors (frames, 2^n) of all frames at once.
+
+        The circuit is only simulated once, since the Rz(phi) rotation of each frame multiplies every amplitude
+        by exp(-i*phi/2) or exp(i*phi/2) depending on whether the rotated qubit is 0 or 1 in that basis state.
+        The values agree with <get_quantum_circuit> up to floating point rounding.
+        """
+        from qiskit.quantum_info import Statevector
+        with profile_stage(self.profiler, "circuit"):
+            base_statevector = Statevector(self.quantum_circuit).data
+        basis_states = np.arange(len(base_statevector))
+
+        # Sum of -1 (qubit is 0) and +1 (qubit is 1) over the rotated qubits for every basis state
+        phase_signs = np.zeros(len(base_statevector))
+        for rotation_index in self.get_rotation_indices(rotate):
+            phase_signs += 2 * ((basis_states >> rotation_index) & 1) - 1
+
+        phi_rotations = np.arange(self.n_frames) * 2 * pi / self.n_frames
+        statevectors = np.exp(0.5j * np.outer(phi_rotations, phase_signs)) * base_statevector
+
+        # Check statevector values and calculate the new statevectors, rounded as in <get_quantum_circuit>
+        statevectors_new = np.zeros(self.n_frames, dtype=np.complex128)
+        nonzero = statevectors[:, 1] != 0
+        ratios = statevectors[nonzero, 0] / statevectors[nonzero, 1]
+        statevectors_new[nonzero] = [round(ratio.real, 2) + round(ratio.imag, 2) * 1j for ratio in ratios]
+        return statevectors_new, statevectors
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from math import pi
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Sequence, Union
+
+# Import project-modules
+from .fractal_bloch import BlochRenderer
+from .fractal_colormap import compose_frame
+from .fractal_frame_scheduler import render_animation
+from .fractal_julia_arrays import GetJuliaArrays
+from .fractal_profiling import Profiler, profile_stage
+from .fractal_video import open_writer
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+
+# Preset circuits, taken from the default circuits of the notebooks, where Qiskit is imported on first use
+# ───────────────────────────────────────────────────────────
+def get_hadamard_circuit() -> "QuantumCircuit":
+    from qiskit import QuantumCircuit
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+    return circuit
+
+
+def get_hadamard_u_circuit() -> "QuantumCircuit":
+    from qiskit import QuantumCircuit
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+    circuit.u(pi / 4, -pi / 3, pi / 8, 0)
+    return circuit
+
+
+def get_ry_tdg_circuit() -> "QuantumCircuit":
+    from qiskit import QuantumCircuit
+    circuit = QuantumCircuit(1)
+    circuit.ry(pi / 2, 0)
+    circuit.tdg(0)
+    return circuit
+
+
+def get_bell_u_circuit() -> "QuantumCircuit":
+    from qiskit import QuantumCircuit
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.u(pi / 4, -pi / 3, pi / 8, 1)
+    return circuit
+
+
+PRESETS: Dict[str, Callable[[], "QuantumCircuit"]] = {
+    "hadamard": get_hadamard_circuit,
+    "hadamard-u": get_hadamard_u_circuit,
+    "ry-tdg": get_ry_tdg_circuit,
+    "bell-u": get_bell_u_circuit,
+}
+
+
+def get_preset_circuit(name: str) -> "QuantumCircuit":
+    if name not in PRESETS:
+        raise ValueError(f"Unknown preset '{name}', expected one of {', '.join(PRESETS)}")
+    return PRESETS[name]()
+
+
+def load_circuit(path: Union[str, Path]) -> "QuantumCircuit":
+    """
+    Loads an OpenQASM 2 or 3 file, depending on its OPENQASM header. Final measurements are removed, as the
+    animation is computed from the statevector of the circuit.
+    """
+    source = Path(path).read_text()
+    if source.lstrip().startswith("OPENQASM 3"):
+        from qiskit import qasm3
+        circuit = qasm3.loads(source)
+    else:
+        from qiskit import qasm2
+        circuit = qasm2.loads(source, custom_instructions=qasm2.LEGACY_CUSTOM_INSTRUCTIONS)
+    return circuit.remove_final_measurements(inplace=False)
+
+
+# ───────────────────────────────────────────────────────────
+def render_to_disk(quantum_circuit: "QuantumCircuit", output: Union[str, Path], julia_arrays: GetJuliaArrays,
+                   number_of_frames: int = 60, rotate: str = "first",
+                   equations: Sequence[str] = ("1cn0", "2cn1", "2cn2"), interval_ms: int = 200,
+                   cmap: str = "magma", bloch: bool = True, workers: Union[int, None] = None,
+                   escape_number: int = 2, power_offset: int = 0,
+                   profiler: Union[Profiler, None] = None) -> int:
+    """
+    Renders the animation of the quantum circuit without a notebook or display and streams it to output, which
+    is a .gif, a video file written by ffmpeg (e.g. .mp4 or .webm) or a directory of PNG frames, see
+    <open_writer>. Each frame shows the Bloch sphere(s), unless bloch is False, next to one Julia Set per
+    equation. The frames are rendered by <render_animation> in a pool of worker processes and written while
+    the remaining frames are still being rendered. Returns the number of frames written.
+    """
+    bloch_renderer = BlochRenderer(size=julia_arrays.shape[0]) if bloch else None
+    with open_writer(output, interval_ms=interval_ms) as writer:
+        for result in render_animation(quantum_circuit, julia_arrays, number_of_frames, rotate, equations, workers,
+                                       escape_number, power_offset, profiler):
+            panels = list(result.julia)
+            if bloch_renderer is not None:
+                with profile_stage(profiler, "bloch", result.frame):
+                    panels.insert(0, bloch_renderer.render(result.statevector))
+            with profile_stage(profiler, "compose", result.frame):
+                frame = compose_frame(panels, cmap=cmap)
+            with profile_stage(profiler, "encode", result.frame):
+                writer.write(frame)
+        return writer.number_of_frames
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Tuple, Union
+import os
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+
+# Only the circuit objects passed in are used, so Qiskit is not imported at runtime
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+
+def get_circuit_hash(quantum_circuit: "QuantumCircuit") -> str:
+    """Canonical hash of a circuit based on its size, global phase, and the name, parameters and qubits of each gate"""
+    digest = sha256(f"{quantum_circuit.num_qubits}|{quantum_circuit.num_clbits}|{quantum_circuit.global_phase!r}".encode())
+    for instruction in quantum_circuit.data:
+        qubits = [quantum_circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        digest.update(f"|{instruction.operation.name}|{qubits}".encode())
+        for param in instruction.operation.params:
+            # Floats by their exact repr, matrices (e.g. unitary gates) by their raw bytes and anything else as text
+            if isinstance(param, ndarray):
+                digest.update(param.tobytes())
+            else:
+                digest.update(repr(param).encode())
+    return digest.hexdigest()
+
+
+class StatevectorCache:
+    """
+    Size-bounded LRU cache of the (statevector_new, statevector array) values returned by
+    <FractalQuantumCircuit.get_quantum_circuit>, with an optional on-disk store that is shared between processes
+    and survives restarts. Pass an instance as statevector_cache to <FractalQuantumCircuit> to use it.
+    """
+    def __init__(self, max_entries: int = 4096, cache_dir: Union[str, Path, None] = None) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.entries: "OrderedDict[str, Tuple[complex, ndarray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(quantum_circuit: "QuantumCircuit", rotation_indices: Iterable[int], frame_iteration: int,
+                total_number_of_frames: int) -> str:
+        """Key of a frame, where rotation_indices are the qubits rotated by the rotation mode"""
+        return sha256(f"{get_circuit_hash(quantum_circuit)}|{list(rotation_indices)}|{frame_iteration}|"
+                      f"{total_number_of_frames}".encode()).hexdigest()
+
+    def get(self, key: str) -> Union[Tuple[complex, ndarray], None]:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.cache_dir is not None and Path(self.cache_dir, f"{key}.npz").exists():
+            with np.load(Path(self.cache_dir, f"{key}.npz")) as data:
+                value = (complex(data["statevector_new"]), data["statevector"])
+            self._insert(key, value)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Tuple[complex, ndarray]) -> None:
+        self._insert(key, value)
+        if self.cache_dir is not None:
+            # Write to a temporary file first, so other processes never read a partially written entry
+            temporary_path = Path(self.cache_dir, f"{key}.{os.getpid()}.tmp.npz")
+            np.savez(temporary_path, statevector_new=value[0], statevector=value[1])
+            os.replace(temporary_path, Path(self.cache_dir, f"{key}.npz"))
+
+    def _insert(self, key: str, value: Tuple[complex, ndarray]) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
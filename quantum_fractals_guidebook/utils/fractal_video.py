@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# coding: utf-8
+# Credits & License: https://github.com/wmazin/Visualizing-Quantum-Computing-using-fractals
+
+# Importing standard python libraries
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, List, Union
+import subprocess
+import shutil
+
+# Import externally installed libraries
+import numpy as np
+from numpy import ndarray
+from PIL import Image, GifImagePlugin
+
+
+class FrameWriter(ABC):
+    """
+    Base class of the streaming writers, which encode and write each RGB frame as soon as it is passed to <write>,
+    so the memory use does not grow with the number of frames. Use as a context manager to finalize the output.
+    """
+    def __init__(self, interval_ms: int = 200) -> None:
+        self.interval_ms = interval_ms
+        self.frame_size: Union[tuple, None] = None
+        self.number_of_frames = 0
+
+    def write(self, frame: ndarray) -> None:
+        frame = np.ascontiguousarray(frame[..., :3], dtype=np.uint8)
+        if self.frame_size is None:
+            self.frame_size = frame.shape
+        elif frame.shape != self.frame_size:
+            raise ValueError(f"All frames must have the shape {self.frame_size}, got {frame.shape}")
+        self._write(frame)
+        self.number_of_frames += 1
+
+    @abstractmethod
+    def _write(self, frame: ndarray) -> None:
+        """Encodes and writes a contiguous uint8 RGB frame"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finalizes the output"""
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GifWriter(FrameWriter):
+    """
+    Writes an animated GIF frame by frame with Pillow, either to a file path or to any binary stream such as an
+    HTTP response, which is flushed after every frame. Each frame is quantized to its own local color table.
+    """
+    def __init__(self, target: Union[str, Path, BinaryIO], interval_ms: int = 200, loop: int = 0) -> None:
+        super().__init__(interval_ms=interval_ms)
+        self.loop = loop
+        self.owns_stream = isinstance(target, (str, Path))
+        self.stream: BinaryIO = open(target, "wb") if self.owns_stream else target
+
+    def _write(self, frame: ndarray) -> None:
+        image = Image.fromarray(frame, mode="RGB").quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        chunks: List[bytes] = []
+        if self.number_of_frames == 0:
+            header, _ = GifImagePlugin.getheader(image, info={"loop": self.loop, "duration": self.interval_ms})
+            chunks.extend(header)
+        chunks.extend(GifImagePlugin.getdata(image, duration=self.interval_ms, include_color_table=True))
+        self.stream.write(b"".join(chunks))
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.stream.closed:
+            return
+        if self.number_of_frames:
+            self.stream.write(b";")
+        self.stream.flush()
+        if self.owns_stream:
+            self.stream.close()
+
+
+class FfmpegWriter(FrameWriter):
+    """
+    Pipes raw RGB frames into ffmpeg, which encodes them while they are being rendered. The output format
+    follows the file suffix, e.g. .mp4, .webm, .apng or .gif.
+    """
+    OUTPUT_ARGS = {
+        ".mp4": ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"],
+        ".webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p"],
+        ".apng": ["-f", "apng", "-plays", "0"],
+        ".gif": ["-loop", "0"],
+    }
+
+    def __init__(self, path: Union[str, Path], interval_ms: int = 200, ffmpeg_path: Union[str, None] = None) -> None:
+        super().__init__(interval_ms=interval_ms)
+        self.path = Path(path)
+        self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
+        if self.ffmpeg_path is None:
+            raise FileNotFoundError("ffmpeg was not found, install it or write a .gif with <GifWriter> instead")
+        self.process: Union[subprocess.Popen, None] = None
+
+    def _write(self, frame: ndarray) -> None:
+        if self.process is None:
+            # The frame size is only known once the first frame arrives
+            height, width = frame.shape[:2]
+            command = [self.ffmpeg_path, "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", "rgb24",
+                       "-s", f"{width}x{height}", "-framerate", f"{1000 / self.interval_ms:g}", "-i", "-",
+                       *self.OUTPUT_ARGS.get(self.path.suffix.lower(), []), str(self.path)]
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.process.stdin.write(frame.tobytes())
+
+    def close(self) -> None:
+        if self.process is None or self.process.stdin.closed:
+            return
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self.process.returncode} while writing {self.path}")
+
+
+class PngSequenceWriter(FrameWriter):
+    """
+    Writes every frame as a numbered PNG file into a directory, e.g. frame_0000.png, frame_0001.png, ..., which
+    can be assembled into a video later or inspected one by one.
+    """
+    def __init__(self, directory: Union[str, Path], interval_ms: int = 200, prefix: str = "frame") -> None:
+        super().__init__(interval_ms=interval_ms)
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _write(self, frame: ndarray) -> None:
+        Image.fromarray(frame, mode="RGB").save(self.directory / f"{self.prefix}_{self.number_of_frames:04d}.png")
+
+    def close(self) -> None:
+        pass
+
+
+def open_writer(path: Union[str, Path], interval_ms: int = 200) -> FrameWriter:
+    """
+    Returns a <GifWriter> for .gif files, a <PngSequenceWriter> for a path without suffix, which is used as the
+    directory of the frames, and a <FfmpegWriter> for every other format
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gif":
+        return GifWriter(path, interval_ms=interval_ms)
+    if suffix == "":
+        return PngSequenceWriter(path, interval_ms=interval_ms)
+    return FfmpegWriter(path, interval_ms=interval_ms)
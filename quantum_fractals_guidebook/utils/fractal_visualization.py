@@ -4,52 +4,76 @@
 
 # Importing standard python libraries
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 from io import BytesIO
 import base64
 
 # Import additional python libraries
-# -- Animation and visualization purposes
-import matplotlib.pyplot as plt
-from matplotlib import font_manager, animation
-from IPython.display import clear_output, HTML
-from celluloid import Camera
+# -- Matplotlib, IPython, celluloid and Qiskit are imported by the methods that use them, which keeps them out of
+#    processes that only stream frames with <qf_stream_frame>, e.g. the command line
 from PIL import Image
 
 # -- Types
-from numpy import ndarray
-
-# -- Quantum
-from qiskit.visualization import plot_bloch_multivector
-from qiskit import QuantumCircuit
+from numpy import ndarray, empty
 
 # Import project-modules
+from .fractal_bloch import BlochRenderer
+from .fractal_colormap import colorize, compose_frame
+from .fractal_video import FrameWriter
 from .fractal_quantum_circuit import FractalQuantumCircuit
-from .fractal_julia_calculations import set_1cn0, set_2cn1, set_2cn2
+from .fractal_profiling import Profiler, profile_stage, get_pixel_iterations
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.font_manager import FontProperties
+    from celluloid import Camera
+    from qiskit import QuantumCircuit
 
-# Load fonts used for visualizations
+# Fonts used for visualizations, registered with matplotlib on first use
 # ───────────────────────────────────────────────────────────────────
 font_path = str(Path(Path(__file__).resolve().parent.parent, "static", "fonts", "IBMPlexMono-SemiBold.ttf"))
-font_manager.fontManager.addfont(font_path)
-prop = font_manager.FontProperties(fname=font_path)
+
+
+@lru_cache(maxsize=1)
+def get_font_properties() -> "FontProperties":
+    from matplotlib import font_manager
+    font_manager.fontManager.addfont(font_path)
+    return font_manager.FontProperties(fname=font_path)
 
 
 # ───────────────────────────────────────────────────────────────────
 class QuantumFractalVisualization:
-    def __init__(self):
+    def __init__(self, bloch_renderer: Union[BlochRenderer, None] = None, profiler: Union[Profiler, None] = None):
         # Variables for Figure and Axis for the Animation method
-        self.gif_fig: Union[plt.subplots, None] = None
-        self.gif_ax: Union[plt.subplots, None] = None
-        self.camera: Union[Camera, None] = None
+        self.gif_fig: Union["plt.Figure", None] = None
+        self.gif_ax: Union[ndarray, None] = None
+        self.camera: Union["Camera", None] = None
         self.gif_gs: Union[int, None] = None
 
         # Shared data the bloch sphere to reduce compute time
         self.bloch_data: Union[BytesIO, None] = None
         self.iterations: Union[int, None] = None
 
-    def save_bloch_as_obj(self, quantum_circuit: QuantumCircuit, frame:int = 0, return_obj: bool = False):
+        # Optional renderer drawing the bloch sphere directly as an RGBA array instead of a PNG of a matplotlib figure
+        self.bloch_renderer = bloch_renderer
+
+        # Optional instrumentation recording the stages 'bloch', 'imshow', 'compose', 'encode' and 'gif'
+        self.profiler = profiler
+
+    def get_bloch_image(self, quantum_circuit: "QuantumCircuit", frame: int = 0) -> Union[ndarray, Image.Image]:
+        """Returns the bloch sphere(s) of the quantum circuit as an image that can be passed to imshow"""
+        with profile_stage(self.profiler, "bloch", frame):
+            if self.bloch_renderer is not None:
+                return self.bloch_renderer.render_circuit(quantum_circuit)
+            self.save_bloch_as_obj(quantum_circuit=quantum_circuit, frame=frame)
+            return Image.open(deepcopy(self.bloch_data))
+
+    def save_bloch_as_obj(self, quantum_circuit: "QuantumCircuit", frame:int = 0, return_obj: bool = False):
         """Instead of saving the bloch sphere as an image, the bloch sphere is saved as an in-memory object."""
+        from qiskit.visualization import plot_bloch_multivector
+
         if return_obj is True:
             bloch_data = BytesIO()
             plot_bloch_multivector(quantum_circuit).savefig(bloch_data, format='png')
@@ -63,37 +87,48 @@ class QuantumFractalVisualization:
             self.bloch_data.seek(0)
             self.iterations = frame
 
-    def qf_images(self, viz_data:Union[ndarray, QuantumCircuit], frame: int = 0) -> None:
-        plt.rcParams['font.family'] = prop.get_name()
+    def qf_images(self, viz_data:Union[ndarray, "QuantumCircuit"], frame: int = 0) -> None:
+        import matplotlib.pyplot as plt
+        from IPython.display import clear_output
+        from qiskit import QuantumCircuit
+
+        plt.rcParams['font.family'] = get_font_properties().get_name()
         plt.rcParams["figure.figsize"] = (20, 5)
         plt.rcParams['figure.dpi'] = 60
 
-        # Dynamically change the number of items included in the final output image
-        img_fig, img_ax = plt.subplots(1, len(viz_data), figsize=(20, 5), clear=True)
-        clear_output(wait=True)
-        # Ensure each item in the visualization data is added to the figure
-        for viz_idx, viz_obj in enumerate(viz_data):
-            if isinstance(viz_obj, QuantumCircuit):
-                # Save bloch sphere as an in-memory object.
-                self.save_bloch_as_obj(quantum_circuit=viz_obj, frame=frame)
+        # The Bloch spheres are drawn up front, so the 'bloch' stage is not counted again within 'imshow'
+        bloch_images = {viz_idx: self.get_bloch_image(quantum_circuit=viz_obj, frame=frame)
+                        for viz_idx, viz_obj in enumerate(viz_data) if isinstance(viz_obj, QuantumCircuit)}
 
-                # Insert the Bloch Sphere image data
-                img_ax[viz_idx].imshow(Image.open(deepcopy(self.bloch_data)))
+        with profile_stage(self.profiler, "imshow", frame):
+            # Dynamically change the number of items included in the final output image
+            img_fig, img_ax = plt.subplots(1, len(viz_data), figsize=(20, 5), clear=True)
+            clear_output(wait=True)
+            # Ensure each item in the visualization data is added to the figure
+            for viz_idx, viz_obj in enumerate(viz_data):
+                if isinstance(viz_obj, QuantumCircuit):
+                    # Insert the Bloch Sphere image data
+                    img_ax[viz_idx].imshow(bloch_images[viz_idx])
 
-            if isinstance(viz_obj, ndarray):
-                # Insert the calculated Julia Set data as an image
-                img_ax[viz_idx].imshow(viz_obj, cmap='magma')
+                if isinstance(viz_obj, ndarray):
+                    # Insert the calculated Julia Set data as an image
+                    img_ax[viz_idx].imshow(viz_obj, cmap='magma')
 
-            # Turn off axis lines and labels
-            img_ax[viz_idx].axis('off')
+                # Turn off axis lines and labels
+                img_ax[viz_idx].axis('off')
 
-        # Finally show the image
-        plt.show()
-        plt.close()
+            # Finally show the image
+            plt.show()
+            plt.close()
+
+    def qf_gif_animation(self, viz_data: Union[ndarray, "QuantumCircuit"], frame: int = 0) -> None:
+        import matplotlib.pyplot as plt
+        from IPython.display import clear_output
+        from qiskit import QuantumCircuit
 
-    def qf_gif_animation(self, viz_data: Union[ndarray, QuantumCircuit], frame: int = 0) -> None:
         if self.gif_fig is None and self.gif_ax is None:
-            plt.rcParams['font.family'] = prop.get_name()
+            from celluloid import Camera
+            plt.rcParams['font.family'] = get_font_properties().get_name()
             plt.rcParams["figure.figsize"] = (20, 5)
             plt.rcParams['figure.dpi'] = 60
 
@@ -104,26 +139,69 @@ class QuantumFractalVisualization:
             self.camera = Camera(self.gif_fig)
             clear_output(wait=True)
 
-        # Ensure each item in the visualization data is added to the figure
-        for gif_img_index, gif_img_obj in enumerate(viz_data):
-            if isinstance(gif_img_obj, QuantumCircuit):
-                # Save bloch sphere as an in-memory object and insert Bloch Sphere image data
-                self.save_bloch_as_obj(quantum_circuit=gif_img_obj, frame=frame)
-                self.gif_ax[gif_img_index].imshow(Image.open(deepcopy(self.bloch_data)))
-            if isinstance(gif_img_obj, ndarray):
-                # Insert the calculated Julia Set data as an image
-                self.gif_ax[gif_img_index].imshow(gif_img_obj, cmap='magma')
-
-        for col in range(0, self.gif_gs.ncols):
-            self.gif_ax[col].axis('off')
-
-        # Finally take a snapshot of the image
-        self.camera.snap()
-        plt.close()
+        # The Bloch spheres are drawn up front, so the 'bloch' stage is not counted again within 'imshow'
+        bloch_images = {gif_img_index: self.get_bloch_image(quantum_circuit=gif_img_obj, frame=frame)
+                        for gif_img_index, gif_img_obj in enumerate(viz_data)
+                        if isinstance(gif_img_obj, QuantumCircuit)}
+
+        with profile_stage(self.profiler, "imshow", frame):
+            # Ensure each item in the visualization data is added to the figure
+            for gif_img_index, gif_img_obj in enumerate(viz_data):
+                if isinstance(gif_img_obj, QuantumCircuit):
+                    # Insert the Bloch Sphere image data
+                    self.gif_ax[gif_img_index].imshow(bloch_images[gif_img_index])
+                if isinstance(gif_img_obj, ndarray):
+                    # Insert the calculated Julia Set data as an image
+                    self.gif_ax[gif_img_index].imshow(gif_img_obj, cmap='magma')
+
+            for col in range(0, self.gif_gs.ncols):
+                self.gif_ax[col].axis('off')
+
+            # Finally take a snapshot of the image
+            self.camera.snap()
+            plt.close()
+
+    def qf_stream_frame(self, writer: FrameWriter, viz_data: Union[ndarray, "QuantumCircuit"], cmap: str = 'magma',
+                        frame: int = 0) -> ndarray:
+        """
+        Composes the visualization data directly into an RGB frame and appends it to a streaming writer from
+        <fractal_video>, as an alternative to <qf_gif_animation> and <save_gif_animation> that keeps no figures
+        in memory and writes the animation while it is being rendered. The frame number labels the profiled stages.
+        """
+        if self.bloch_renderer is None:
+            self.bloch_renderer = BlochRenderer()
+        panels = [obj if isinstance(obj, ndarray) else self.get_bloch_image(obj, frame) for obj in viz_data]
+        with profile_stage(self.profiler, "compose", frame):
+            image = compose_frame(panels, cmap=cmap)
+        with profile_stage(self.profiler, "encode", frame):
+            writer.write(image)
+        return image
+
+    @staticmethod
+    def qf_progressive_image(z_arr: ndarray, c: Union[complex, ndarray], equation: str = '1cn0', cmap: str = 'magma',
+                             start_scale: int = 8) -> ndarray:
+        """
+        Shows a Julia set in the notebook while it is rendered by <render_progressive>, replacing the image after
+        every pass, so a coarse preview appears long before the full resolution image is done.
+        """
+        from IPython.display import display
+        from .fractal_julia_progressive import render_progressive
+
+        handle = None
+        for _, div in render_progressive(z_arr, c, equation, start_scale=start_scale):
+            image = Image.fromarray(colorize(div, cmap=cmap))
+            if handle is None:
+                handle = display(image, display_id=True)
+            else:
+                handle.update(image)
+        return div
 
     def save_gif_animation(self, blit:bool = True, interval_ms:int = 200, no_frames:int = 60, no_qubits: int = 1):
-        anim = self.camera.animate(blit=blit, interval=interval_ms)
-        anim.save(f'img/Quantum_Fractal_Animation_{no_frames}_frames_{no_qubits}_qubits.gif', writer='ffmpeg')
+        from IPython.display import clear_output, HTML
+
+        with profile_stage(self.profiler, "gif"):
+            anim = self.camera.animate(blit=blit, interval=interval_ms)
+            anim.save(f'img/Quantum_Fractal_Animation_{no_frames}_frames_{no_qubits}_qubits.gif', writer='ffmpeg')
 
         clear_output(wait=True)
         with open(f"img/Quantum_Fractal_Animation_{no_frames}_frames_{no_qubits}_qubits.gif", 'rb') as fd:
@@ -131,8 +209,13 @@ class QuantumFractalVisualization:
         return HTML(f'<img src="data:image/gif;base64,{b64}" />')
 
     # noinspection SpellCheckingInspection
-    def qf_interactive_animation(self, quantum_circuit, frame_no, z_arr, con_arr, div_arr, height, width, interval):
-        plt.rcParams['font.family'] = prop.get_name()
+    def qf_interactive_animation(self, quantum_circuit, frame_no, z_arr, con_arr, div_arr, height, width, interval,
+                                 max_iterations: int = 100):
+        import matplotlib.pyplot as plt
+        from matplotlib import animation
+        from .fractal_julia_calculations import set_fused
+
+        plt.rcParams['font.family'] = get_font_properties().get_name()
         plt.rcParams["animation.html"] = "jshtml"
         plt.rcParams["figure.figsize"] = (20, 5)
         plt.rcParams['figure.dpi'] = 60
@@ -142,17 +225,38 @@ class QuantumFractalVisualization:
         anim_gs = anim_ax[0].get_gridspec()
 
         # Initiate the two classes responsible for generating the Bloch's sphere and visualizations
-        fractal_circuit = FractalQuantumCircuit(quantum_circuit=quantum_circuit, total_number_of_frames=frame_no)
+        fractal_circuit = FractalQuantumCircuit(number_of_qubits=quantum_circuit.num_qubits,
+                                                quantum_circuit=quantum_circuit, total_number_of_frames=frame_no,
+                                                profiler=self.profiler)
+
+        # The three Julia Sets are computed in a single pass into a buffer of the type of <div_arr> that is reused
+        # by every frame, which makes copies of <con_arr> and <div_arr> unnecessary. Pixels that <con_arr> leaves
+        # out keep their value of <div_arr>, as with the original kernels.
+        julia_arr = empty((3, height, width), dtype=div_arr.dtype)
+        excluded = None if con_arr is None or con_arr.all() else ~con_arr
 
         def animate(index):
             for col in range(0, anim_gs.ncols):
                 anim_ax[col].cla()
 
             cno, ccircuit, ccn = fractal_circuit.get_quantum_circuit(frame_iteration=index)
-            anim_ax[0].imshow(Image.open(self.save_bloch_as_obj(quantum_circuit=ccircuit, return_obj=True)))
-            anim_ax[1].imshow(set_1cn0(c=cno, z=z_arr.copy(), con=con_arr.copy(), div=div_arr.copy(), height=height, width=width), cmap='magma')
-            anim_ax[2].imshow(set_2cn1(c=ccn, z=z_arr.copy(), con=con_arr.copy(), div=div_arr.copy(), height=height, width=width), cmap='magma')
-            anim_ax[3].imshow(set_2cn2(c=ccn, z=z_arr.copy(), con=con_arr.copy(), div=div_arr.copy(), height=height, width=width), cmap='magma')
+            with profile_stage(self.profiler, "bloch", index):
+                if self.bloch_renderer is not None:
+                    bloch_image = self.bloch_renderer.render(ccn)
+                else:
+                    bloch_image = Image.open(self.save_bloch_as_obj(quantum_circuit=ccircuit, return_obj=True))
+            with profile_stage(self.profiler, "julia", index) as stats:
+                set_fused(c=cno, cn=ccn, z=z_arr, div=julia_arr, max_iterations=max_iterations, height=height,
+                          width=width)
+                if excluded is not None:
+                    julia_arr[:, excluded] = div_arr[excluded]
+                if self.profiler is not None:
+                    stats["pixel_iterations"] = get_pixel_iterations(julia_arr)
+            with profile_stage(self.profiler, "imshow", index):
+                anim_ax[0].imshow(bloch_image)
+                anim_ax[1].imshow(julia_arr[0], cmap='magma')
+                anim_ax[2].imshow(julia_arr[1], cmap='magma')
+                anim_ax[3].imshow(julia_arr[2], cmap='magma')
 
             for col in range(0, anim_gs.ncols):
                 anim_ax[col].axis('off')